@@ -3,6 +3,8 @@ from datetime import timedelta
 import frappe
 from frappe.utils import add_days, get_datetime
 
+from taskstream.taskstream.config import get_config
+
 
 @frappe.whitelist()
 def delete_file_if_exists(file_name):
@@ -12,12 +14,9 @@ def delete_file_if_exists(file_name):
 
 
 def get_reporting_window():
-	last_executed_on, reporting_frequency = frappe.db.get_value(
-		"Work Item Configuration", "Work Item Configuration", ["last_executed_on", "reporting_frequency"]
-	)
-	last_executed_on = get_datetime(last_executed_on).date()
-	start_date = add_days(last_executed_on, 1)
-	end_date = add_days(start_date, int(reporting_frequency or 0) - 1)
+	config = get_config()
+	start_date = add_days(get_datetime(config.last_executed_on).date(), 1)
+	end_date = add_days(start_date, config.reporting_frequency - 1)
 	return f"{start_date.strftime('%b %d')} - {end_date.strftime('%b %d')}"
 
 
@@ -48,8 +47,6 @@ def get_all_work_flow_template_tasks(wft):
 
 
 def clear_employee_cache():
-	from taskstream.taskstream.report.work_item_score_board.work_item_score_board import (
-		_fetch_employees_active,
-	)
+	from taskstream.taskstream.org_tree import clear_org_tree_cache
 
-	_fetch_employees_active.cache_clear()
+	clear_org_tree_cache()
@@ -0,0 +1,52 @@
+# Copyright (c) 2026, Chethan - Aerele and contributors
+# For license information, please see license.txt
+
+# Expands 10-year recurrence rules at every frequency.
+# Run with `bench --site <site> execute taskstream.benchmarks.recurrence.run`
+# or `python -m taskstream.benchmarks.recurrence` from the bench environment.
+
+from datetime import date, timedelta
+from time import perf_counter
+
+from taskstream.taskstream.recurrence import RecurrenceRule
+
+TIMES = [timedelta(hours=9), timedelta(hours=13, minutes=30), timedelta(hours=18)]
+
+RULES = {
+	"Daily": RecurrenceRule("Daily", times=TIMES),
+	"Daily (every 3 days)": RecurrenceRule("Daily", frequency=3, times=TIMES),
+	"Weekly": RecurrenceRule("Weekly", times=TIMES, weekdays=["Monday", "Wednesday", "Friday"]),
+	"Weekly (every 2 weeks)": RecurrenceRule(
+		"Weekly", frequency=2, times=TIMES, weekdays=["Tuesday", "Thursday"]
+	),
+	"Monthly by Date": RecurrenceRule("Monthly", times=TIMES, monthly_based_on="Date", dates=[1, 15, 31]),
+	"Monthly by Day": RecurrenceRule(
+		"Monthly",
+		times=TIMES,
+		monthly_based_on="Day",
+		day_occurrences=[("First", "Monday"), ("Third", "Wednesday"), ("Last", "Friday")],
+	),
+	"Yearly": RecurrenceRule(
+		"Yearly", times=TIMES, dates=[1, 15, 31], months=["January", "April", "July", "October"]
+	),
+}
+
+
+def run(years=10, repeat=5):
+	start_date = date.today()
+	end_date = date(start_date.year + int(years), start_date.month, min(start_date.day, 28))
+	results = []
+	for label, rule in RULES.items():
+		best = None
+		for _ in range(int(repeat)):
+			started = perf_counter()
+			slots = sum(1 for _ in rule.occurrences(start_date, end_date))
+			elapsed = perf_counter() - started
+			best = elapsed if best is None else min(best, elapsed)
+		results.append((label, slots, best))
+		print(f"{label:<24} {slots:>8} slots {best * 1000:>9.2f} ms")
+	return results
+
+
+if __name__ == "__main__":
+	run()
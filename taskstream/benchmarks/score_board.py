@@ -0,0 +1,64 @@
+# Copyright (c) 2026, Chethan - Aerele and contributors
+# For license information, please see license.txt
+
+# Rolls team scores up a synthetic 50k employee org chart, a wide one and a single chain.
+# Run with `bench --site <site> execute taskstream.benchmarks.score_board.run`
+# or `python -m taskstream.benchmarks.score_board` from the bench environment.
+
+import random
+from collections import defaultdict
+from time import perf_counter
+
+from taskstream.taskstream.report.work_item_score_board.work_item_score_board import build_team_rows
+
+CYCLES = [f"Cycle {i}" for i in range(6)]
+
+
+def make_org(employees, span):
+	# Employee i reports to (i - 1) // span, so span=1 is one chain as deep as the company
+	rng = random.Random(employees)
+	employee_to_user = {}
+	employee_display_by_name = {}
+	reports_to_by_employee = {}
+	children_by_manager = defaultdict(list)
+	stats_by_user = {}
+	user_cycle_stats = {}
+	for i in range(employees):
+		employee = f"HR-EMP-{i:05d}"
+		user = f"user-{i}@example.com"
+		manager = f"HR-EMP-{(i - 1) // span:05d}" if i else None
+		employee_to_user[employee] = user
+		employee_display_by_name[employee] = f"Employee {i}"
+		reports_to_by_employee[employee] = manager
+		if manager:
+			children_by_manager[manager].append(employee)
+		stats_by_user[user] = {"total_score": rng.randint(-50, 0), "work_item_count": rng.randint(0, 20)}
+		user_cycle_stats[user] = {
+			cycle: {"total": rng.uniform(-20, 0), "count": rng.randint(1, 5)} for cycle in CYCLES
+		}
+	return (
+		employee_to_user,
+		employee_display_by_name,
+		reports_to_by_employee,
+		children_by_manager,
+		stats_by_user,
+	), user_cycle_stats
+
+
+def run(employees=50000, repeat=3):
+	results = []
+	for label, span in (("Wide (span 8)", 8), ("Chain (span 1)", 1)):
+		org, user_cycle_stats = make_org(int(employees), span)
+		best = None
+		for _ in range(int(repeat)):
+			started = perf_counter()
+			rows = build_team_rows(*org, CYCLES, user_cycle_stats)
+			elapsed = perf_counter() - started
+			best = elapsed if best is None else min(best, elapsed)
+		results.append((label, len(rows), best))
+		print(f"{label:<16} {len(rows):>8} rows {best * 1000:>9.2f} ms")
+	return results
+
+
+if __name__ == "__main__":
+	run()
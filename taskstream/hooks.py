@@ -84,6 +84,7 @@ app_include_css = ["taskstream.bundle.css"]
 
 # before_install = "taskstream.install.before_install"
 after_install = "taskstream.patches.install.execute"
+after_migrate = "taskstream.taskstream.reminders.rebuild_reminder_timers"
 
 # Uninstallation
 # ------------
@@ -149,6 +150,28 @@ permission_query_conditions = {
 # 	}
 # }
 
+doc_events = {
+	"Holiday List": {
+		"on_update": "taskstream.taskstream.holiday_calendar.clear_holiday_cache",
+		"on_trash": "taskstream.taskstream.holiday_calendar.clear_holiday_cache",
+	},
+	"User": {
+		"on_update": "taskstream.taskstream.assignment.clear_role_users_cache",
+		"on_trash": "taskstream.taskstream.assignment.clear_role_users_cache",
+	},
+	"Employee": {
+		"after_insert": "taskstream.taskstream.org_tree.on_employee_change",
+		"on_update": [
+			"taskstream.taskstream.holiday_calendar.clear_employee_holiday_list_cache",
+			"taskstream.taskstream.org_tree.on_employee_change",
+		],
+		"on_trash": [
+			"taskstream.taskstream.holiday_calendar.clear_employee_holiday_list_cache",
+			"taskstream.taskstream.org_tree.on_employee_change",
+		],
+	},
+}
+
 # Scheduled Tasks
 # ---------------
 
@@ -173,12 +196,15 @@ permission_query_conditions = {
 scheduler_events = {
 	"daily": [
 		"taskstream.taskstream.tasks.report_data.get_report_data",
+		"taskstream.taskstream.tasks.materialize.materialize_recurrences",
 	],
+	"hourly": ["taskstream.taskstream.tasks.report_data.resume_score_runs"],
 	"weekly": ["taskstream.api.clear_employee_cache"],
 	"cron": {
 		"* * * * *": [
 			"taskstream.taskstream.doctype.work_item.work_item.send_twenty_percent_reminders",
 			"taskstream.taskstream.doctype.work_item.work_item.send_deadline_reminders",
+			"taskstream.taskstream.tasks.notifications.flush_notification_outbox",
 		]
 	},
 }
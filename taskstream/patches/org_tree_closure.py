@@ -0,0 +1,9 @@
+import frappe
+
+from taskstream.taskstream.org_tree import rebuild_org_closure
+
+
+def execute():
+	if not frappe.db.exists("DocType", "Employee"):
+		return
+	rebuild_org_closure()
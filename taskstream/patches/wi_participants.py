@@ -0,0 +1,22 @@
+import frappe
+
+from taskstream.taskstream.doctype.work_item_participant.work_item_participant import (
+	PARTICIPANT_FIELDS,
+	set_participants,
+)
+
+
+def execute():
+	last_name = ""
+	while True:
+		work_items = frappe.get_all(
+			"Work Item",
+			filters={"name": (">", last_name)},
+			fields=list(PARTICIPANT_FIELDS),
+			order_by="name asc",
+			limit=1000,
+		)
+		if not work_items:
+			break
+		set_participants(work_items)
+		last_name = work_items[-1].name
@@ -0,0 +1,50 @@
+import json
+from datetime import datetime, timedelta
+
+import frappe
+
+from taskstream.taskstream.doctype.work_item_slot.work_item_slot import set_schedule
+
+
+def execute():
+	# valid_dates is gone from the doctype, but model sync leaves the column behind on old sites
+	if frappe.db.has_column("Work Item", "valid_dates"):
+		move_valid_dates_to_slots()
+
+	frappe.db.sql("""
+        UPDATE `tabWork Item` master
+        INNER JOIN (
+            SELECT reference_document, MAX(target_end_date) AS last_slot
+            FROM `tabWork Item`
+            WHERE reference_doctype = 'Work Item'
+            GROUP BY reference_document
+        ) wi ON wi.reference_document = master.name
+        SET master.materialized_until = wi.last_slot
+        WHERE master.work_item_type = 'Recurrence Master'
+    """)
+
+
+def move_valid_dates_to_slots():
+	masters = frappe.db.sql(
+		"""
+		SELECT name, valid_dates
+		FROM `tabWork Item`
+		WHERE work_item_type = 'Recurrence Master'
+			AND IFNULL(valid_dates, '') != ''
+		""",
+		as_dict=True,
+	)
+	for master in masters:
+		set_schedule(
+			master.name,
+			[
+				datetime.fromisoformat(d["date"]) + timedelta(seconds=d["time_seconds"])
+				for d in json.loads(master.valid_dates)
+			],
+		)
+
+	frappe.db.sql("""
+        UPDATE `tabWork Item`
+        SET valid_dates = NULL
+        WHERE valid_dates IS NOT NULL
+    """)
@@ -0,0 +1,29 @@
+import frappe
+
+
+def execute():
+	# Same keys and names as work_item_score_aggregate.update_score_aggregates
+	frappe.db.delete("Work Item Cycle Score")
+	frappe.db.delete("Work Item Score Aggregate")
+
+	frappe.db.sql("""
+        INSERT INTO `tabWork Item Cycle Score`
+            (name, creation, modified, owner, modified_by, work_item, report_cycle, assignee, max_score)
+        SELECT SHA1(CONCAT_WS('|', work_item, report_cycle, assignee)), NOW(), NOW(),
+            'Administrator', 'Administrator', work_item, report_cycle, assignee, MAX(COALESCE(score, 0))
+        FROM `tabWork Item Score Summary`
+        WHERE action = 'Scheduled Job'
+            AND IFNULL(work_item, '') != ''
+            AND IFNULL(report_cycle, '') != ''
+            AND IFNULL(assignee, '') != ''
+        GROUP BY work_item, report_cycle, assignee
+    """)
+
+	frappe.db.sql("""
+        INSERT INTO `tabWork Item Score Aggregate`
+            (name, creation, modified, owner, modified_by, assignee, report_cycle, total_score, work_item_count)
+        SELECT SHA1(CONCAT_WS('|', assignee, report_cycle)), NOW(), NOW(),
+            'Administrator', 'Administrator', assignee, report_cycle, SUM(max_score), COUNT(*)
+        FROM `tabWork Item Cycle Score`
+        GROUP BY assignee, report_cycle
+    """)
@@ -0,0 +1,25 @@
+import frappe
+
+
+def execute():
+	# The earliest created Work Item of each reference and trigger takes the key, same hash as
+	# get_dedup_key
+	frappe.db.sql(
+		"""
+		UPDATE `tabWork Item` wi
+		INNER JOIN (
+			SELECT
+				name,
+				ROW_NUMBER() OVER (
+					PARTITION BY reference_doctype, reference_document, summary
+					ORDER BY creation, name
+				) AS row_no
+			FROM `tabWork Item`
+			WHERE reference_doctype != 'Work Item'
+				AND IFNULL(reference_document, '') != ''
+				AND IFNULL(summary, '') != ''
+		) ranked ON ranked.name = wi.name AND ranked.row_no = 1
+		SET wi.dedup_key = SHA1(CONCAT_WS('|', wi.reference_doctype, wi.reference_document, wi.summary))
+		WHERE wi.dedup_key IS NULL
+		"""
+	)
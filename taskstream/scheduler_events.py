@@ -1,9 +1,12 @@
+import hashlib
 from datetime import timedelta
 
 import frappe
 from frappe.utils import now_datetime
 
-EXCLUDED_USERS = ("Administrator", "Guest")
+from taskstream.taskstream.assignment import EXCLUDED_USERS, pick_assignee
+
+DEDUP_SAVEPOINT = "taskstream_trigger_work_item"
 
 
 def customer_on_create_trigger(doc, method):
@@ -59,15 +62,8 @@ def so_on_create_trigger(doc, method):
 
 
 def _create_work_item(doc, roles, summary, description):
-	if frappe.db.exists(
-		"Work Item",
-		{
-			"reference_doctype": doc.doctype,
-			"reference_document": doc.name,
-			"summary": summary,
-			"description": description,
-		},
-	):
+	dedup_key = get_dedup_key(doc.doctype, doc.name, summary)
+	if trigger_work_item_exists(dedup_key):
 		return
 	wi = frappe.new_doc("Work Item")
 	wi.reporter = None
@@ -76,36 +72,37 @@ def _create_work_item(doc, roles, summary, description):
 	wi.description = description
 	wi.reference_doctype = doc.doctype
 	wi.reference_document = doc.name
+	wi.dedup_key = dedup_key
 	wi.recurrence_type = "One Time"
 	wi.target_end_date = _get_future_time(2)
 	# wi.append("activities", {"action_type": "Target End Date", "time": _get_future_time(2)})
-	wi.save()
+
+	# A concurrent save of the same document can get past the exists check, the unique key decides
+	frappe.db.savepoint(DEDUP_SAVEPOINT)
+	try:
+		wi.insert()
+	except (frappe.UniqueValidationError, frappe.DuplicateEntryError):
+		frappe.db.rollback(save_point=DEDUP_SAVEPOINT)
+		frappe.clear_last_message()
+		return
+	frappe.db.release_savepoint(DEDUP_SAVEPOINT)
+
+
+def trigger_work_item_exists(dedup_key):
+	return frappe.db.exists("Work Item", {"dedup_key": dedup_key})
+
+
+def get_dedup_key(reference_doctype, reference_document, summary):
+	# The wi_trigger_dedup_key patch computes the same value with SHA1(CONCAT_WS('|', ...))
+	return hashlib.sha1("|".join((reference_doctype, reference_document, summary)).encode()).hexdigest()
 
 
 def _get_work_item_assignee(doc, roles):
 	if isinstance(roles, str):
 		roles = (roles,)
 
-	role_order = ",".join(["%s"] * len(roles))
-	excluded_users = ",".join(["%s"] * len(EXCLUDED_USERS))
-	params = tuple(roles) + EXCLUDED_USERS + tuple(roles)
-
-	if assignee := frappe.db.sql(
-		f"""
-        SELECT DISTINCT u.name
-        FROM `tabHas Role` hr
-        INNER JOIN `tabUser` u ON u.name = hr.parent
-        WHERE hr.role IN ({role_order})
-            AND u.enabled = 1
-            AND u.user_type = 'System User'
-            AND u.name NOT IN ({excluded_users})
-        ORDER BY FIELD(hr.role, {role_order}), RAND()
-        LIMIT 1
-        """,
-		params,
-		as_dict=False,
-	):
-		return assignee[0][0]
+	if assignee := pick_assignee(roles):
+		return assignee
 
 	if getattr(doc, "owner", None) and doc.owner not in EXCLUDED_USERS:
 		return doc.owner
@@ -1,24 +1,48 @@
 import frappe
-from frappe.desk.doctype.notification_log.notification_log import enqueue_create_notification
+from frappe.utils import now_datetime
 
+OUTBOX_FIELDS = (
+	"name",
+	"creation",
+	"modified",
+	"owner",
+	"modified_by",
+	"recipient",
+	"work_item",
+	"subject",
+	"document_type",
+	"document_name",
+	"from_user",
+	"content",
+)
 
-def send_notifications(work_item, content, to, doctype=None, docname=None):
-	config = frappe.get_single("Work Item Configuration")
-	if config.email_alert:
-		frappe.sendmail(
-			recipients=to,
-			subject=f"Notification for Work Item: {work_item}",
-			message=content,
-		)
 
-	if config.system_notification:
-		for user in to:
-			notification_doc = {
-				"type": "Share",
-				"document_type": "Work Item" if doctype is None else doctype,
-				"subject": f"Notification for Work Item: {work_item}",
-				"document_name": work_item if docname is None else docname,
-				"from_user": frappe.session.user,
-			}
+def send_notifications(work_item, content, to, doctype=None, docname=None):
+	# Events go to the outbox with the caller's transaction, flush_notification_outbox sends them as digests
+	recipients = list(dict.fromkeys(user for user in to if user))
+	if not recipients:
+		return
 
-			enqueue_create_notification(user, notification_doc)
+	now = now_datetime()
+	user = frappe.session.user
+	frappe.db.bulk_insert(
+		"Work Item Notification Outbox",
+		OUTBOX_FIELDS,
+		[
+			(
+				frappe.generate_hash(length=10),
+				now,
+				now,
+				user,
+				user,
+				recipient,
+				work_item,
+				f"Notification for Work Item: {work_item}",
+				"Work Item" if doctype is None else doctype,
+				work_item if docname is None else docname,
+				user,
+				content,
+			)
+			for recipient in recipients
+		],
+	)
@@ -0,0 +1,107 @@
+# Copyright (c) 2026, Chethan - Aerele and contributors
+# For license information, please see license.txt
+
+import frappe
+
+ROLE_USERS_CACHE_KEY = "taskstream:role_users"
+OPEN_WORK_ITEMS_CACHE_KEY = "taskstream:open_work_items"
+ROUND_ROBIN_CACHE_KEY = "taskstream:assignment_round_robin"
+EXCLUDED_USERS = ("Administrator", "Guest")
+# Work Item fields that move an item in or out of someone's open count
+LOAD_FIELDS = ("status", "assignee")
+
+
+def pick_assignee(roles):
+	# Users of the first role that has any, least open Work Items first. Ties rotate per role so
+	# equally loaded users take turns.
+	for role in roles:
+		users = get_role_users(role)
+		if not users:
+			continue
+
+		open_counts = get_open_counts(users)
+		start = frappe.cache.incr(frappe.cache.make_key(f"{ROUND_ROBIN_CACHE_KEY}:{role}")) % len(users)
+		rotated = users[start:] + users[:start]
+		# The new Work Item clears the assignee's count on insert
+		return min(rotated, key=open_counts.__getitem__)
+
+	return None
+
+
+def get_role_users(role):
+	# Enabled system users with the role, sorted so the round robin order is stable
+	users = frappe.cache.hget(ROLE_USERS_CACHE_KEY, role)
+	if users is None:
+		users = tuple(
+			user
+			for (user,) in frappe.db.sql(
+				"""
+				SELECT DISTINCT u.name
+				FROM `tabHas Role` hr
+				INNER JOIN `tabUser` u ON u.name = hr.parent
+				WHERE hr.role = %s
+					AND hr.parenttype = 'User'
+					AND u.enabled = 1
+					AND u.user_type = 'System User'
+					AND u.name NOT IN %s
+				ORDER BY u.name
+				""",
+				(role, EXCLUDED_USERS),
+			)
+		)
+		frappe.cache.hset(ROLE_USERS_CACHE_KEY, role, users)
+	return users
+
+
+def get_open_counts(users):
+	# Open Work Items per user in one HMGET, users not cached yet are counted on the
+	# (assignee, status) index. Counts are plain integers written through raw pipelines, the
+	# RedisWrapper hash helpers pickle values and go one field per call.
+	key = frappe.cache.make_key(OPEN_WORK_ITEMS_CACHE_KEY)
+	pipeline = frappe.cache.pipeline()
+	pipeline.hmget(key, users)
+	open_counts = {
+		user: int(count) if count is not None else None
+		for user, count in zip(users, pipeline.execute()[0], strict=True)
+	}
+	missing = [user for user, count in open_counts.items() if count is None]
+	if missing:
+		counted = dict(
+			frappe.db.sql(
+				"""
+				SELECT assignee, COUNT(*)
+				FROM `tabWork Item`
+				WHERE assignee IN %s AND status != 'Done'
+				GROUP BY assignee
+				""",
+				(missing,),
+			)
+		)
+		open_counts.update({user: counted.get(user, 0) for user in missing})
+		pipeline.hset(key, mapping={user: open_counts[user] for user in missing})
+		pipeline.execute()
+	return open_counts
+
+
+def clear_open_counts(users):
+	# Recounted on the next read. Again after commit, a read in between could cache the old count.
+	users = [user for user in set(users) if user]
+	if not users:
+		return
+
+	def _clear():
+		pipeline = frappe.cache.pipeline()
+		pipeline.hdel(frappe.cache.make_key(OPEN_WORK_ITEMS_CACHE_KEY), *users)
+		pipeline.execute()
+
+	_clear()
+	frappe.db.after_commit.add(_clear)
+
+
+def _delete_role_users():
+	frappe.cache.delete_key(ROLE_USERS_CACHE_KEY)
+
+
+def clear_role_users_cache(doc=None, method=None):
+	_delete_role_users()
+	frappe.db.after_commit.add(_delete_role_users)
@@ -0,0 +1,59 @@
+# Copyright (c) 2026, Chethan - Aerele and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.utils import cint, now_datetime
+
+BULK_INSERT_CHUNK_SIZE = 1000
+
+
+def reserve_names(series, count, digits=4):
+	# Same bookkeeping as frappe.model.naming.getseries, but moves the counter by `count` at once
+	if count <= 0:
+		return []
+
+	current = frappe.db.sql("SELECT `current` FROM `tabSeries` WHERE `name`=%s FOR UPDATE", (series,))
+	if current and current[0][0] is not None:
+		start = cint(current[0][0])
+		frappe.db.sql("UPDATE `tabSeries` SET `current` = `current` + %s WHERE `name`=%s", (count, series))
+	else:
+		start = 0
+		frappe.db.sql("INSERT INTO `tabSeries` (`name`, `current`) VALUES (%s, %s)", (series, count))
+
+	return [
+		f"{series}{('%0' + str(digits) + 'd') % current}" for current in range(start + 1, start + count + 1)
+	]
+
+
+def bulk_insert_docs(docs, chunk_size=BULK_INSERT_CHUNK_SIZE):
+	"""Writes new, already named documents and their child rows with multi-row inserts.
+
+	Controller hooks are not run, callers are expected to have set every derived field.
+	"""
+	if not docs:
+		return
+
+	now = now_datetime()
+	user = frappe.session.user
+	rows_by_doctype = {}
+
+	def _collect(d):
+		d.creation = d.creation or now
+		d.modified = now
+		d.owner = d.owner or user
+		d.modified_by = user
+		d.docstatus = 0
+		valid_dict = d.get_valid_dict(convert_dates_to_str=True, ignore_nulls=False, ignore_virtual=True)
+		fields, rows = rows_by_doctype.setdefault(d.doctype, (list(valid_dict), []))
+		rows.append(tuple(valid_dict.get(field) for field in fields))
+
+	for doc in docs:
+		_collect(doc)
+		for child in doc.get_all_children():
+			child.name = child.name or frappe.generate_hash(length=10)
+			child.parent = doc.name
+			child.parenttype = doc.doctype
+			_collect(child)
+
+	for doctype, (fields, rows) in rows_by_doctype.items():
+		frappe.db.bulk_insert(doctype, fields, rows, chunk_size=chunk_size)
@@ -0,0 +1,135 @@
+# Copyright (c) 2026, Chethan - Aerele and contributors
+# For license information, please see license.txt
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import frappe
+from frappe.utils import cint, flt, getdate
+
+CONFIG_VERSION_CACHE_KEY = "taskstream:config_version"
+
+# Latest snapshot per site for this process, reused while its version matches the cache stamp
+_snapshots = {}
+
+
+@dataclass(frozen=True)
+class WorkItemConfig:
+	"""Read-only copy of Work Item Configuration with the field values already cast."""
+
+	version: str
+	recurrence_creation_limit: int
+	sent_reminder_before: timedelta
+	max_file_attachment_size: int
+	email_alert: bool
+	system_notification: bool
+	notification_digest_window: int
+	skip_holidays_based_on: str | None
+	default_holiday: str | None
+	include_saturday: bool
+	include_saturday_nonemp: bool
+	max_delay_penalty: float
+	max_rework_penalty: float
+	penalty_points_per_day: float
+	penalty_per_minute: float
+	completion_score: int
+	revision_impact: int
+	rework_impact: int
+	max_allowed_revision: int
+	max_allowed_rework: int
+	reporting_frequency: int
+	no_of_cycles_in_report: int
+	last_executed_on: date | None
+	starting_date: date | None
+
+	@classmethod
+	def from_doc(cls, doc, version):
+		return cls(
+			version=version,
+			recurrence_creation_limit=cint(doc.recurrence_creation_limit),
+			sent_reminder_before=_get_time_delta(doc.sent_reminder_before),
+			max_file_attachment_size=cint(doc.max_file_attachment_size),
+			email_alert=bool(cint(doc.email_alert)),
+			system_notification=bool(cint(doc.system_notification)),
+			notification_digest_window=cint(doc.notification_digest_window),
+			skip_holidays_based_on=doc.skip_holidays_based_on,
+			default_holiday=doc.default_holiday,
+			include_saturday=bool(cint(doc.include_saturday)),
+			include_saturday_nonemp=bool(cint(doc.include_saturday_nonemp)),
+			max_delay_penalty=flt(doc.max_delay_penalty),
+			max_rework_penalty=flt(doc.max_rework_penalty),
+			penalty_points_per_day=flt(doc.penalty_points_per_day),
+			penalty_per_minute=flt(doc.penalty_per_minute),
+			completion_score=cint(doc.completion_score),
+			revision_impact=cint(doc.revision_impact),
+			rework_impact=cint(doc.rework_impact),
+			max_allowed_revision=cint(doc.max_allowed_revision),
+			max_allowed_rework=cint(doc.max_allowed_rework),
+			reporting_frequency=cint(doc.reporting_frequency),
+			no_of_cycles_in_report=cint(doc.no_of_cycles_in_report),
+			last_executed_on=getdate(doc.last_executed_on) if doc.last_executed_on else None,
+			starting_date=getdate(doc.starting_date) if doc.starting_date else None,
+		)
+
+
+def get_config():
+	# Cached for the request on frappe.local, and across requests of this process by version
+	config = getattr(frappe.local, "taskstream_config", None)
+	if config is None:
+		config = frappe.local.taskstream_config = _get_snapshot()
+	return config
+
+
+def invalidate_config(doc=None, method=None):
+	# Until the transaction ends it reads its own uncommitted values, outside the process snapshot
+	frappe.local.taskstream_config = None
+	frappe.local.taskstream_config_written = True
+	frappe.db.after_commit.add(_bump_config_version)
+	frappe.db.after_commit.add(_end_config_write)
+	frappe.db.after_rollback.add(_end_config_write)
+
+
+def set_last_executed_on(value):
+	frappe.db.set_value("Work Item Configuration", "Work Item Configuration", "last_executed_on", value)
+	invalidate_config()
+
+
+def _get_snapshot():
+	if getattr(frappe.local, "taskstream_config_written", False):
+		# A version of its own, so nothing cached by version is shared with other transactions
+		return WorkItemConfig.from_doc(
+			frappe.get_single("Work Item Configuration"), frappe.generate_hash(length=10)
+		)
+
+	# The version is read before the document, so a snapshot is never tagged newer than its values
+	version = frappe.cache.get_value(CONFIG_VERSION_CACHE_KEY)
+	snapshot = _snapshots.get(frappe.local.site)
+	if version and snapshot and snapshot.version == version:
+		return snapshot
+
+	if not version:
+		version = _bump_config_version()
+	snapshot = WorkItemConfig.from_doc(frappe.get_single("Work Item Configuration"), version)
+	_snapshots[frappe.local.site] = snapshot
+	return snapshot
+
+
+def _bump_config_version():
+	version = frappe.generate_hash(length=10)
+	frappe.cache.set_value(CONFIG_VERSION_CACHE_KEY, version)
+	return version
+
+
+def _end_config_write():
+	frappe.local.taskstream_config = None
+	frappe.local.taskstream_config_written = False
+
+
+def _get_time_delta(value):
+	# Whole minutes only, seconds were never part of the reminder offset
+	if not value:
+		return timedelta()
+	if isinstance(value, timedelta):
+		return timedelta(minutes=int(value.total_seconds()) // 60)
+	hours, minutes = [int(float(part)) for part in str(value).split(":")[:2]]
+	return timedelta(hours=hours, minutes=minutes)
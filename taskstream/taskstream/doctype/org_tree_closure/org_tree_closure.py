@@ -0,0 +1,14 @@
+# Copyright (c) 2026, Chethan - Aerele and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+
+
+class OrgTreeClosure(Document):
+	pass
+
+
+def on_doctype_update():
+	frappe.db.add_index("Org Tree Closure", ["ancestor", "descendant_user"])
+	frappe.db.add_index("Org Tree Closure", ["descendant"])
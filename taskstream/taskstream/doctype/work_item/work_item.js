@@ -26,6 +26,7 @@ frappe.ui.form.on("Work Item", {
 		add_recalculate_score_button(frm);
 		set_wft_tasks(frm, frm.doc.work_flow_template);
 		setTimeout(() => render_recurrence_calendar(frm), 300);
+		render_score_summary(frm);
 		const { user } = frappe.session;
 		const type = frm.doc.recurrence_type || "One Time";
 		const work_item_type = frm.doc.work_item_type || null;
@@ -763,6 +764,21 @@ function update_recurrence_description(frm) {
 	render_recurrence_calendar(frm);
 }
 
+function render_score_summary(frm) {
+	// The breakdown is stored as numbers, the summary text is only built when the form is opened
+	if (frm.is_new() || !frm.doc.score_config) {
+		frm.set_df_property("score_summary_html", "options", frm.doc.score_summary || "");
+		return;
+	}
+	frappe.call({
+		method: "taskstream.taskstream.doctype.work_item.work_item.get_score_summary_html",
+		args: { doctype: frm.doctype, docname: frm.doc.name },
+		callback: (r) => {
+			frm.set_df_property("score_summary_html", "options", r.message || "");
+		},
+	});
+}
+
 function render_recurrence_calendar(frm) {
 	const type = frm.doc.recurrence_type;
 	const isRecurringInstance = frm.doc.work_item_type === "Recurring Instance";
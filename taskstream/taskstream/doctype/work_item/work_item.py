@@ -11,9 +11,29 @@ from frappe.model.naming import make_autoname
 from frappe.utils import get_datetime, getdate, now_datetime
 
 from taskstream.taskstream import send_notifications
+from taskstream.taskstream.assignment import LOAD_FIELDS, clear_open_counts
+from taskstream.taskstream.bulk import bulk_insert_docs, reserve_names
+from taskstream.taskstream.config import get_config
+from taskstream.taskstream.doctype.work_item_participant.work_item_participant import (
+	PARTICIPANT_FIELDS,
+	clear_participants,
+	set_participants,
+	sync_participants,
+)
 from taskstream.taskstream.doctype.work_item_score_summary.work_item_score_summary import (
+	buffered_summaries,
 	create_summary_record,
 )
+from taskstream.taskstream.doctype.work_item_slot.work_item_slot import (
+	get_next_slot,
+	set_schedule,
+	slot_exists,
+)
+from taskstream.taskstream.holiday_calendar import get_working_calendar
+from taskstream.taskstream.recurrence import compile_rule, parse_recurrence_time
+from taskstream.taskstream.reminders import dispatch_reminders, schedule_reminders
+from taskstream.taskstream.score_board_cache import SCORE_BOARD_FIELDS, invalidate_score_board
+from taskstream.taskstream.scoring import compute_score, get_breakdown_fields, get_score_config
 
 
 def safe_exec(func):
@@ -84,45 +104,27 @@ class WorkItem(Document):
 	def create_work_item_recurrences(self):
 		if not (self.reference_document and self.reference_doctype):
 			return
-		valid_dates = json.loads(self.valid_dates) if self.valid_dates else []
-		valid_dates = [
-			(datetime.fromisoformat(d["date"]).date(), timedelta(seconds=d["time_seconds"]))
-			for d in valid_dates
-		]
-		# current_slot = None
-		# for rows in self.activities:
-		# 	if rows.action_type == "Target End Date":
-		# 		date_time = rows.time
-		# 		date = date_time.date()
-		# 		t = date_time.time()
-		# 		target_time = timedelta(hours=t.hour, minutes=t.minute, seconds=t.second)
-		# 		current_slot = (date, target_time)
-
-		target_end_datetime = get_datetime(self.target_end_date)
-		date = target_end_datetime.date()
-		t = target_end_datetime.time()
-		target_time = timedelta(hours=t.hour, minutes=t.minute, seconds=t.second)
-		current_slot = (date, target_time)
-
-		if current_slot and current_slot in valid_dates:
-			current_index = valid_dates.index(current_slot)
-			for next_date in valid_dates[current_index + 1 :]:
-				target_end_datetime = datetime.combine(next_date[0], datetime.min.time()) + next_date[1]
-				existing_wi = bool(
-					frappe.db.exists(
-						"Work Item",
-						{
-							"reference_document": self.reference_document,
-							"reference_doctype": self.reference_doctype,
-							"target_end_date": target_end_datetime.strftime("%Y-%m-%d %H:%M:%S"),
-							"summary": self.summary,
-							"description": self.description,
-						},
-					)
-				)
-				if not existing_wi:
-					create_work_item_recurrences(self, next_date[0], next_date[1])
-					break
+
+		current_slot = get_datetime(self.target_end_date)
+		if not slot_exists(self.reference_document, current_slot):
+			return
+
+		# Every slot up to the master's cursor already has an instance, the lock keeps concurrent
+		# completions from picking the same next slot
+		materialized_until = frappe.db.sql(
+			"SELECT materialized_until FROM `tabWork Item` WHERE name = %s FOR UPDATE",
+			(self.reference_document,),
+		)
+		cursor = current_slot
+		if materialized_until and materialized_until[0][0]:
+			cursor = max(cursor, get_datetime(materialized_until[0][0]))
+
+		if next_slot := get_next_slot(self.reference_document, cursor):
+			next_slot = get_datetime(next_slot)
+			create_work_item_recurrences(
+				self, next_slot.date(), next_slot - datetime.combine(next_slot.date(), datetime.min.time())
+			)
+			set_materialized_until(self.reference_document, next_slot)
 
 	@safe_exec
 	def validate_reviewer(self):
@@ -199,36 +201,61 @@ class WorkItem(Document):
 	def after_insert(self):
 		if self.recurrence_type in ["One Time"] or self.work_item_type == "Recurring Instance":
 			return
-		creation_limit = frappe.get_single_value("Work Item Configuration", "recurrence_creation_limit")
+		creation_limit = get_config().recurrence_creation_limit
 
 		start_date = getdate(self.start_from)
 		end_date = datetime.strptime(str(getdate(self.repeat_until)), "%Y-%m-%d").date()
 		max_creation_date = start_date + timedelta(days=creation_limit)
 		values = _get_valid_dates(self, start_date, end_date)
-
-		serialized_valid_dates = []
-		serialized_valid_dates.extend(
-			{
-				"date": valid_date.isoformat(),
-				"time_seconds": (
-					int(recurrence_time.total_seconds()) if isinstance(recurrence_time, timedelta) else 0
-				),
-			}
-			for valid_date, recurrence_time in values
-		)
-		self.db_set("valid_dates", json.dumps(serialized_valid_dates))
+		set_schedule(self.name, [_get_slot_datetime(*value) for value in values])
 
 		creatable_values = [value for value in values if value[0] <= max_creation_date]
 
 		if len(creatable_values) > creation_limit:
 			creatable_values = creatable_values[:creation_limit]
-		if len(creatable_values) > 0:
-			for value in creatable_values:
-				create_work_item_recurrences(self, value[0], value[1])
-		else:
-			create_work_item_recurrences(self, values[0][0], values[0][1])
+		if len(creatable_values) == 0:
+			creatable_values = values[:1]
+		if creatable_values:
+			bulk_create_work_item_recurrences(self, creatable_values)
+			self.db_set(
+				"materialized_until",
+				max(_get_slot_datetime(*value) for value in creatable_values),
+				update_modified=False,
+			)
 
-		frappe.db.commit()
+	def on_update(self):
+		if any(self.has_value_changed(field) for field in PARTICIPANT_FIELDS):
+			set_participants([self])
+		if any(
+			self.has_value_changed(field)
+			for field in ("status", "target_end_date", "twenty_percent_reminder_time")
+		):
+			schedule_reminders([self])
+		if any(self.has_value_changed(field) for field in SCORE_BOARD_FIELDS):
+			invalidate_score_board()
+		if any(self.has_value_changed(field) for field in LOAD_FIELDS):
+			previous = self.get_doc_before_save()
+			clear_open_counts([self.assignee, previous and previous.assignee])
+
+	def on_trash(self):
+		clear_participants(self.name)
+		invalidate_score_board()
+		clear_open_counts([self.assignee])
+		if self.work_item_type == "Recurrence Master":
+			set_schedule(self.name, [])
+
+
+def on_doctype_update():
+	# status + date ranges: both reports, the score board and the reminder rebuild
+	frappe.db.add_index("Work Item", ["status", "target_end_date"])
+	frappe.db.add_index("Work Item", ["status", "actual_end_date"])
+	# instances of a master or of a triggering document: _get_work_item, materialize, triggers
+	frappe.db.add_index("Work Item", ["reference_doctype", "reference_document", "target_end_date"])
+	frappe.db.add_index("Work Item", ["assignee", "status"])
+	frappe.db.add_index("Work Item", ["work_item_type", "repeat_until"])
+	# unsent reminders by due time: reminders.rebuild_reminder_timers
+	frappe.db.add_index("Work Item", ["twenty_percent_reminder_sent", "twenty_percent_reminder_time"])
+	frappe.db.add_index("Work Item", ["deadline_reminder_sent", "target_end_date"])
 
 
 def is_end_date_not_in_past(date):
@@ -238,134 +265,15 @@ def is_end_date_not_in_past(date):
 
 
 def _get_valid_dates(self, start_date, end_date):
-	import calendar
-	import datetime as dt
-
-	def _parse_recurrence_time(recurrence_time):
-		try:
-			if isinstance(recurrence_time, str) and ":" in recurrence_time:
-				t = recurrence_time.split(":")
-				return timedelta(hours=int(t[0]), minutes=int(t[1]), seconds=0)
-			else:
-				return timedelta(hours=int(recurrence_time))
-		except (ValueError, TypeError, IndexError):
-			return timedelta(hours=0)
-
-	parsed_times = [_parse_recurrence_time(t.recurrence_time) for t in self.recurrence_time]
-	valid_dates = []
-
-	if self.recurrence_type == "Daily":
-		frequency = int(self.recurrence_frequency or 1)
-		current_date = start_date
-		while current_date <= end_date:
-			days_diff = (current_date - start_date).days
-			if days_diff % frequency == 0:
-				for time_delta in parsed_times:
-					valid_dates.append((current_date, time_delta))
-			current_date += timedelta(days=1)
-
-	elif self.recurrence_type == "Weekly":
-		days_map = {
-			"Monday": 0,
-			"Tuesday": 1,
-			"Wednesday": 2,
-			"Thursday": 3,
-			"Friday": 4,
-			"Saturday": 5,
-			"Sunday": 6,
-		}
-
-		target_days = [days_map[d.weekday] for d in self.recurrence_day if d.weekday in days_map]
-		frequency = int(self.recurrence_frequency or 1)
-
-		current_date = start_date
-		while current_date <= end_date:
-			if current_date.weekday() in target_days:
-				weeks_diff = (current_date - start_date).days // 7
-				if weeks_diff % frequency == 0:
-					for time_delta in parsed_times:
-						valid_dates.append((current_date, time_delta))
-			current_date += timedelta(days=1)
-
-	elif self.recurrence_type == "Monthly":
-		frequency = int(self.recurrence_frequency or 1)
-		current_month = start_date.month
-		current_year = start_date.year
-		while dt.date(current_year, current_month, 1) <= end_date:
-			if self.monthly_recurrence_based_on == "Date":
-				for row in self.recurrence_date:
-					last_day = calendar.monthrange(current_year, current_month)[1]
-					actual_day = min(row.recurrence_date, last_day)
-					generated_date = dt.date(current_year, current_month, actual_day)
-
-					if start_date < generated_date <= end_date:
-						for time_delta in parsed_times:
-							if (generated_date, time_delta) not in valid_dates:
-								valid_dates.append((generated_date, time_delta))
-
-				current_month += frequency
-				while current_month > 12:
-					current_month -= 12
-					current_year += 1
-			if self.monthly_recurrence_based_on == "Day":
-				for row in self.recurrence_day_occurrence:
-					order = row.week_order
-					week_day = row.weekday
-					generated_date = _get_nth_weekday(current_year, current_month, week_day, order)
-
-					if start_date < generated_date <= end_date:
-						for time_delta in parsed_times:
-							if (generated_date, time_delta) not in valid_dates:
-								valid_dates.append((generated_date, time_delta))
-
-				current_month += frequency
-				while current_month > 12:
-					current_month -= 12
-					current_year += 1
-
-	elif self.recurrence_type == "Yearly":
-		frequency = int(self.recurrence_frequency or 1)
-		month_map = {
-			"January": 1,
-			"February": 2,
-			"March": 3,
-			"April": 4,
-			"May": 5,
-			"June": 6,
-			"July": 7,
-			"August": 8,
-			"September": 9,
-			"October": 10,
-			"November": 11,
-			"December": 12,
-		}
-
-		days = [int(d.recurrence_date) for d in self.recurrence_date]
-		months = [m.month for m in self.recurrence_month]
-
-		years = list(range(start_date.year, end_date.year + 1, frequency))
-		date_combinations = [
-			(year, month_map.get(month), day) for year in years for month in months for day in days
-		]
-		for y, m, d in date_combinations:
-			last_day = calendar.monthrange(y, m)[1]
-			actual_day = min(d, last_day)
-			generated_date = dt.date(y, m, actual_day)
-			if start_date < generated_date <= end_date:
-				for time_delta in parsed_times:
-					valid_dates.append((generated_date, time_delta))
-
-	return check_date_validity(self, valid_dates)
+	return check_date_validity(self, compile_rule(self).occurrences(start_date, end_date))
 
 
 def check_date_validity(self, valid_dates):
 	try:
-		skip_map = {
-			"Holidays": 0,
-			"Weekdays": 4,
-		}
 		dates = []
+		seen = set()
 		now = now_datetime()
+		repeat_until = get_datetime(self.repeat_until).date()
 
 		def _as_datetime(date_value, time_value):
 			base = datetime.combine(date_value, datetime.min.time())
@@ -375,45 +283,16 @@ def check_date_validity(self, valid_dates):
 				return datetime.combine(date_value, time_value)
 			return base
 
-		settings = frappe.get_single("Work Item Configuration")
-		skip_type = skip_map.get(settings.skip_holidays_based_on)
-		if skip_type == 4 and settings.include_saturday:
-			skip_type = 5
-
-		if skip_type == 0:
-			holiday_doc = (
-				settings.default_holiday
-				or frappe.db.get_value("Employee", {"user_id": self.assignee}, "holiday_list")
-				or None
-			)
-			if not holiday_doc:
-				skip_type = 5 if settings.include_saturday_nonemp else 4
-
-		if frappe.db.exists("Module Def", "Setup") and skip_type == 0 and holiday_doc:
-			for date, time in valid_dates:
-				if _as_datetime(date, time) < now:
-					continue
-				if frappe.db.exists("Holiday", {"holiday_date": date, "parent": holiday_doc}):
-					while True:
-						if not frappe.db.exists("Holiday", {"holiday_date": date, "parent": holiday_doc}):
-							break
-						date -= timedelta(days=1)
-				if _as_datetime(date, time) < now:
-					continue
-				if (date, time) not in dates and date <= get_datetime(self.repeat_until).date():
-					dates.append((date, time))
-		else:
-			for date, time in valid_dates:
-				if _as_datetime(date, time) < now:
-					continue
-				while True:
-					if date.weekday() <= skip_type:
-						break
-					date -= timedelta(days=1)
-				if _as_datetime(date, time) < now:
-					continue
-				if (date, time) not in dates and date <= get_datetime(self.repeat_until).date():
-					dates.append((date, time))
+		working_calendar = get_working_calendar(self.assignee)
+		for slot_date, slot_time in valid_dates:
+			if _as_datetime(slot_date, slot_time) < now:
+				continue
+			slot_date = working_calendar.previous_working_day(slot_date)
+			if _as_datetime(slot_date, slot_time) < now:
+				continue
+			if (slot_date, slot_time) not in seen and slot_date <= repeat_until:
+				seen.add((slot_date, slot_time))
+				dates.append((slot_date, slot_time))
 
 		return dates
 	except Exception as e:
@@ -421,36 +300,6 @@ def check_date_validity(self, valid_dates):
 		frappe.db.commit()
 
 
-def _get_nth_weekday(year, month, weekday, occurrence):
-	days_map = {
-		"Monday": 0,
-		"Tuesday": 1,
-		"Wednesday": 2,
-		"Thursday": 3,
-		"Friday": 4,
-		"Saturday": 5,
-		"Sunday": 6,
-	}
-	week_order_map = {"First": 1, "Second": 2, "Third": 3, "Fourth": 4, "Last": 5}
-	from datetime import datetime
-
-	weekday = days_map.get(weekday)
-	occurrence = week_order_map.get(occurrence)
-	first_day = datetime(year, month, 1)
-
-	days_until_target = (weekday - first_day.weekday()) % 7
-	first_occurrence = first_day + timedelta(days=days_until_target)
-
-	if occurrence <= 4:
-		target_date = first_occurrence + timedelta(weeks=occurrence - 1)
-	else:
-		target_date = first_occurrence + timedelta(weeks=3)
-		if (target_date + timedelta(weeks=1)).month == month:
-			target_date += timedelta(weeks=1)
-
-	return None if target_date.month != month else target_date.date()
-
-
 def create_work_item_recurrences(wi_doc, date, recurrence_time):
 	new_wi = frappe.copy_doc(wi_doc)
 	new_wi.name = None
@@ -465,14 +314,7 @@ def create_work_item_recurrences(wi_doc, date, recurrence_time):
 	if isinstance(recurrence_time, timedelta):
 		time_delta = recurrence_time
 	else:
-		try:
-			if isinstance(recurrence_time, str) and ":" in recurrence_time:
-				t = recurrence_time.split(":")
-				time_delta = timedelta(hours=int(t[0]), minutes=int(t[1]), seconds=0)
-			else:
-				time_delta = timedelta(hours=int(recurrence_time))
-		except (ValueError, TypeError, IndexError):
-			time_delta = timedelta(hours=0)
+		time_delta = parse_recurrence_time(recurrence_time)
 
 	# new_wi.append(
 	# 	"activities",
@@ -493,10 +335,77 @@ def create_work_item_recurrences(wi_doc, date, recurrence_time):
 	return new_wi
 
 
+@safe_exec
+def bulk_create_work_item_recurrences(wi_doc, slots):
+	# Same result as calling create_work_item_recurrences for every slot, without the per instance
+	# save: derived fields are computed once and all rows go out in a few multi-row inserts.
+	if not slots:
+		return []
+
+	template = frappe.copy_doc(wi_doc)
+	template.score = 0
+	template.rework_count = 0
+	template.revision_count = 0
+	template.benefit_of_work_done = 100
+	template.work_item_type = "Recurring Instance"
+	template.actual_end_date = None
+	template.status = "Open"
+	template.reference_doctype = "Work Item"
+	template.reference_document = (
+		wi_doc.reference_document if wi_doc.work_item_type == "Recurring Instance" else wi_doc.name
+	)
+	template.owner = wi_doc.owner
+	template.materialized_until = None
+	template.target_end_date = _get_slot_datetime(*slots[0])
+	if not template.assigned_on:
+		template.assigned_on = now_datetime().date()
+	if template.work_flow_template and template.work_flow and template.idx == 0:
+		template.idx = 1
+	template.validate_reviewer()
+	calculate_score(template, "Work Item Update")
+	reminder_delta = _get_reminder_delta()
+
+	instances = []
+	for name, (date, recurrence_time) in zip(reserve_names("WI-", len(slots)), slots, strict=True):
+		new_wi = frappe.copy_doc(template)
+		new_wi.name = name
+		new_wi.owner = template.owner
+		new_wi.target_end_date = _get_slot_datetime(date, recurrence_time)
+		new_wi.twenty_percent_reminder_time = _get_reminder_time(new_wi.target_end_date, reminder_delta)
+		new_wi.twenty_percent_reminder_sent = 0
+		instances.append(new_wi)
+
+	bulk_insert_docs(instances)
+	set_participants(instances)
+	schedule_reminders(instances)
+	clear_open_counts([template.assignee])
+	return instances
+
+
+def set_materialized_until(master, slot_datetime):
+	# Only ever moves the cursor forward, completions and the horizon job can both advance it
+	frappe.db.sql(
+		"""
+		UPDATE `tabWork Item`
+		SET materialized_until = %(slot)s
+		WHERE name = %(master)s
+			AND (materialized_until IS NULL OR materialized_until < %(slot)s)
+		""",
+		{"master": master, "slot": slot_datetime},
+	)
+
+
+def _get_slot_datetime(date, recurrence_time):
+	if not isinstance(recurrence_time, timedelta):
+		recurrence_time = parse_recurrence_time(recurrence_time)
+	return datetime.combine(date, datetime.min.time()) + recurrence_time
+
+
 @frappe.whitelist()
 @safe_exec
 def send_for_review(docname, reviewer):
 	frappe.db.set_value("Work Item", docname, "status", "Under Review")
+	invalidate_score_board()
 	content = f"A work item <b>{docname}</b> has been sent for review.<br><a href='{frappe.utils.get_url()}/app/work-item/{docname}'>View Work Item</a>"
 	send_notifications(docname, content, to=[reviewer])
 
@@ -553,13 +462,17 @@ def calculate_planned_target(doc):
 
 	if planned_end_time := doc.target_end_date:
 		planned_end_time = get_datetime(planned_end_time)
-		sent_alert_on = frappe.get_single_value("Work Item Configuration", "sent_reminder_before")
-		hr, mm, sec = [int(float(x)) for x in sent_alert_on.split(":")]
-		total_minutes = hr * 60 + mm
-		reminder_delta = timedelta(minutes=total_minutes)
-		doc.twenty_percent_reminder_time = planned_end_time - reminder_delta
-		doc.twenty_percent_reminder_time = doc.twenty_percent_reminder_time.replace(second=0, microsecond=0)
+		doc.twenty_percent_reminder_time = _get_reminder_time(planned_end_time, _get_reminder_delta())
 		doc.twenty_percent_reminder_sent = 0
+		doc.deadline_reminder_sent = 0
+
+
+def _get_reminder_delta():
+	return get_config().sent_reminder_before
+
+
+def _get_reminder_time(planned_end_time, reminder_delta):
+	return (planned_end_time - reminder_delta).replace(second=0, microsecond=0)
 
 
 @safe_exec
@@ -573,47 +486,12 @@ def ensure_time(value):
 	return value
 
 
-# def send_twenty_percent_reminders():
-# 	now = now_datetime().replace(second=0, microsecond=0)
-# 	items = frappe.get_all("Work Item", filters={
-# 		"status": "In Progress",
-# 		"twenty_percent_reminder_sent": 0,
-# 		"twenty_percent_reminder_time": ("=", now)
-# 	}, fields=["name", "assignee"])
-
-# 	for item in items:
-# 		user_email = frappe.db.get_value("User", item.assignee, "email")
-# 		if user_email:
-# 			frappe.sendmail(
-# 				recipients=[user_email],
-# 				subject=f"Reminder: Work Item {item.name} nearing deadline",
-# 				message=f"You're at 20% remaining time for the Work Item <b>{item.name}</b>. Please plan accordingly.<br><a href='{frappe.utils.get_url()}/app/work-item/{item.name}'>View Work Item</a>",
-# 				now=True
-# 			)
-# 			frappe.db.set_value("Work Item", item.name, "twenty_percent_reminder_sent", 1)
-# 		else:
-# 			frappe.log_error("Work Item Reminder Error", f"User {item.assignee} does not have a valid email.")
-
-# def send_deadline_reminders():
-# 	now = now_datetime().replace(second=0, microsecond=0)
-# 	items = frappe.get_all("Work Item", filters={
-# 		"status": "In Progress",
-# 		"deadline_reminder_sent": 0,
-# 		"planned_end": ("=", now)
-# 	}, fields=["name", "assignee"])
-
-# 	for item in items:
-# 		user_email = frappe.db.get_value("User", item.assignee, "email")
-# 		if user_email:
-# 			frappe.sendmail(
-# 				recipients=[user_email],
-# 				subject=f"Work Item {item.name} Deadline Reached",
-# 				message=f"The deadline is met for the Work Item <b>{item.name}</b>, but it's still marked as <i>In Progress</i>. Please review it.<br><a href='{frappe.utils.get_url()}/app/work-item/{item.name}'>View Work Item</a>",
-# 				now=True
-# 			)
-# 			frappe.db.set_value("Work Item", item.name, "deadline_reminder_sent", 1)
-# 		else:
-# 			frappe.log_error("Deadline Reminder Error", f"User {item.assignee} has no valid email.")
+def send_twenty_percent_reminders():
+	dispatch_reminders("twenty_percent")
+
+
+def send_deadline_reminders():
+	dispatch_reminders("deadline")
 
 
 @safe_exec
@@ -633,47 +511,48 @@ def calculate_score(doc, type):
 	# if actual_end_time is None or row.time > actual_end_time:
 	# 	actual_end_time = row.time
 
-	planned_end_time = get_datetime(doc.target_end_date) if doc.target_end_date else None
-	actual_end_time = get_datetime(doc.actual_end_date) if doc.actual_end_date else now_datetime()
-
-	if not planned_end_time:
+	config = get_config()
+	breakdown = compute_score(
+		config,
+		doc.target_end_date,
+		doc.actual_end_date,
+		doc.benefit_of_work_done,
+		doc.revision_count,
+		doc.rework_count,
+	)
+	if not breakdown:
 		return
 
-	# if actual_end_time <= planned_end_time:
-	# 	doc.score = 0
-	# 	return
-
-	if actual_end_time:
-		config = frappe.get_single("Work Item Configuration")
-		total_delay_minutes = (actual_end_time - planned_end_time).total_seconds() / 60
-		if actual_end_time <= planned_end_time:
-			delay_penalty = 0
-		elif total_delay_minutes < 1440:
-			delay_penalty = total_delay_minutes * config.penalty_per_minute
-		else:
-			delay_penalty = ((total_delay_minutes // 1440) * config.penalty_points_per_day) + (
-				(total_delay_minutes % 1440) * config.penalty_per_minute
-			)
-		delay_penalty = min(delay_penalty, config.max_delay_penalty)
-	else:
-		delay_penalty = 0
-	benefit_penalty = _get_benefit_penelty(doc.benefit_of_work_done, config.completion_score)
-	revision_penalty = ((doc.revision_count or 0) / config.max_allowed_revision) * config.revision_impact
-	rework_penalty = ((doc.rework_count or 0) / config.max_allowed_rework) * config.rework_impact
-	rework_penalty = min(rework_penalty, config.max_rework_penalty)
-	total_score = 0 - benefit_penalty - delay_penalty - revision_penalty - rework_penalty
-	doc.score = max(total_score, -100)
+	doc.score = breakdown.score
 	if doc.is_new():
 		return
-	doc.score_summary = score_summary(
-		delay_penalty,
-		rework_penalty,
-		revision_penalty,
-		benefit_penalty,
+	doc.update(get_breakdown_fields(breakdown, get_score_config(config)))
+	# run create_summary_record if type = Scheduled Job or if there are changes in score, status, rework_count, revision_count, target_end_date (check with data before save)
+	if type == "Scheduled Job" or (
+		type == "Work Item Update"
+		and any(
+			doc.has_value_changed(f)
+			for f in ("score", "status", "rework_count", "revision_count", "target_end_date")
+		)
+	):
+		create_summary_record(doc, type)
+
+
+def render_score_summary(doc):
+	# Rows scored before the breakdown was stored as numbers only carry the rendered text
+	if not doc.score_config:
+		return doc.get("score_summary") or doc.get("summary")
+
+	config = frappe.get_cached_doc("Work Item Score Config", doc.score_config)
+	return score_summary(
+		doc.delay_penalty,
+		doc.rework_penalty,
+		doc.revision_penalty,
+		doc.benefit_penalty,
 		doc.score,
 		doc.target_end_date,
 		doc.actual_end_date,
-		total_delay_minutes,
+		doc.delay_minutes,
 		config.penalty_per_minute,
 		doc.rework_count,
 		config.rework_impact,
@@ -686,29 +565,24 @@ def calculate_score(doc, type):
 		benefit_of_work_done=doc.benefit_of_work_done,
 		completion_score=config.completion_score,
 	)
-	# run create_summary_record if type = Scheduled Job or if there are changes in score, status, rework_count, revision_count, target_end_date (check with data before save)
-	if type == "Scheduled Job" or (
-		type == "Work Item Update"
-		and any(
-			doc.has_value_changed(f)
-			for f in ("score", "status", "rework_count", "revision_count", "target_end_date")
-		)
-	):
-		create_summary_record(doc.score_summary, doc.name, doc.score, type)
 
 
 @frappe.whitelist()
-@safe_exec
-def recalculate_score(docname):
-	doc = frappe.get_doc("Work Item", docname)
-	calculate_score(doc, "Work Item Update")
-	doc.save()
+def get_score_summary_html(doctype, docname):
+	if doctype not in ("Work Item", "Work Item Score Summary"):
+		frappe.throw(f"Score summary is not available for {doctype}")
+	doc = frappe.get_doc(doctype, docname)
+	doc.check_permission("read")
+	return render_score_summary(doc)
 
 
+@frappe.whitelist()
 @safe_exec
-def _get_benefit_penelty(benefit_of_work_done, completion_score):
-	benefit_of_work_done = 100 - float(benefit_of_work_done or 0)
-	return (benefit_of_work_done / 100) * completion_score
+def recalculate_score(docname):
+	doc = frappe.get_doc("Work Item", docname)
+	with buffered_summaries():
+		calculate_score(doc, "Work Item Update")
+		doc.save()
 
 
 @frappe.whitelist()
@@ -811,6 +685,9 @@ def reassign(wi, new_assignee, current_assignee, reason):
 	reassign_doc.reassigned_by = frappe.session.user
 	reassign_doc.save()
 	frappe.db.set_value("Work Item", wi, "assignee", new_assignee)
+	sync_participants([wi])
+	invalidate_score_board()
+	clear_open_counts([new_assignee, current_assignee])
 	content = "Re-Assignment has been initiated. Click <a href='{frappe.utils.get_url()}/app/work-item/{wi}'>here</a> to view the work item"
 	to = [
 		current_assignee,
@@ -823,13 +700,14 @@ def reassign(wi, new_assignee, current_assignee, reason):
 @safe_exec
 def apply_updates_to_work_item(docname, updates, one_time=False, change_date=None):
 	updates = json.loads(updates)
-	if one_time and change_date:
-		wi_names = _get_work_item(docname, change_date)
-		for name in wi_names:
-			_update_work_item(name, updates)
-	else:
-		_purge_work_item(docname)
-		_update_work_item(docname, updates)
+	with buffered_summaries():
+		if one_time and change_date:
+			wi_names = _get_work_item(docname, change_date)
+			for name in wi_names:
+				_update_work_item(name, updates)
+		else:
+			_purge_work_item(docname)
+			_update_work_item(docname, updates)
 
 
 @safe_exec
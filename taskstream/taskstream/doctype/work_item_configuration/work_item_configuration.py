@@ -5,6 +5,8 @@ import frappe
 from frappe.model.document import Document
 from frappe.utils import add_days
 
+from taskstream.taskstream.config import invalidate_config
+
 
 class WorkItemConfiguration(Document):
 	def validate(self):
@@ -13,3 +15,6 @@ class WorkItemConfiguration(Document):
 			frappe.throw("Reporting frequency cannot be more than 31 days.")
 		if self.starting_date and not self.last_executed_on:
 			self.last_executed_on = add_days(self.starting_date, -1)
+
+	def on_update(self):
+		invalidate_config()
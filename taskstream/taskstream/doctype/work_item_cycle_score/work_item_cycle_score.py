@@ -0,0 +1,13 @@
+# Copyright (c) 2026, Chethan - Aerele and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+
+
+class WorkItemCycleScore(Document):
+	pass
+
+
+def on_doctype_update():
+	frappe.db.add_index("Work Item Cycle Score", ["assignee", "report_cycle"])
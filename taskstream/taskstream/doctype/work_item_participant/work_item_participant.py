@@ -0,0 +1,79 @@
+# Copyright (c) 2026, Chethan - Aerele and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import now_datetime
+
+from taskstream.taskstream.bulk import BULK_INSERT_CHUNK_SIZE
+
+PARTICIPANT_ROLES = {
+	"requester": "Requester",
+	"reporter": "Reporter",
+	"assignee": "Assignee",
+	"reviewer": "Reviewer",
+}
+PARTICIPANT_FIELDS = ("name", "work_item_type", *PARTICIPANT_ROLES)
+# Visibility classes that let the user see the Work Item, see permission.work_item_user_condition
+VISIBLE_CLASSES = ("Owner", "Participant")
+
+
+class WorkItemParticipant(Document):
+	pass
+
+
+def on_doctype_update():
+	frappe.db.add_index("Work Item Participant", ["user", "visibility", "work_item"])
+	frappe.db.add_index("Work Item Participant", ["work_item"])
+
+
+def get_visibility(work_item_type, fieldname):
+	# Requesters and reporters see every Work Item, assignees and reviewers do not see masters
+	if fieldname in ("requester", "reporter"):
+		return "Owner"
+	if (work_item_type or "") in ("Recurring Instance", ""):
+		return "Participant"
+	return "Hidden"
+
+
+def set_participants(work_items):
+	# work_items are docs or rows holding PARTICIPANT_FIELDS
+	if not work_items:
+		return
+
+	frappe.db.delete("Work Item Participant", {"work_item": ("in", [wi.name for wi in work_items])})
+
+	now = now_datetime()
+	user = frappe.session.user
+	rows = [
+		(
+			frappe.generate_hash(length=10),
+			wi.name,
+			wi.get(fieldname),
+			role,
+			get_visibility(wi.work_item_type, fieldname),
+			now,
+			now,
+			user,
+			user,
+		)
+		for wi in work_items
+		for fieldname, role in PARTICIPANT_ROLES.items()
+		if wi.get(fieldname)
+	]
+	frappe.db.bulk_insert(
+		"Work Item Participant",
+		["name", "work_item", "user", "role", "visibility", "creation", "modified", "owner", "modified_by"],
+		rows,
+		chunk_size=BULK_INSERT_CHUNK_SIZE,
+	)
+
+
+def sync_participants(names):
+	set_participants(
+		frappe.get_all("Work Item", filters={"name": ("in", names)}, fields=list(PARTICIPANT_FIELDS))
+	)
+
+
+def clear_participants(work_item):
+	frappe.db.delete("Work Item Participant", {"work_item": work_item})
@@ -0,0 +1,158 @@
+# Copyright (c) 2026, Chethan - Aerele and contributors
+# For license information, please see license.txt
+
+import hashlib
+from collections import defaultdict
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import flt, now_datetime
+
+CYCLE_SCORE_SAVEPOINT = "taskstream_cycle_score"
+CYCLE_SCORE_INSERT = """
+	INSERT INTO `tabWork Item Cycle Score`
+		(name, creation, modified, owner, modified_by, work_item, report_cycle, assignee, max_score)
+	VALUES {}
+"""
+
+
+class WorkItemScoreAggregate(Document):
+	pass
+
+
+def on_doctype_update():
+	frappe.db.add_index("Work Item Score Aggregate", ["report_cycle", "assignee"])
+
+
+def get_key_name(*values):
+	# Rows are named after their key, so upserts can use the primary key; matches SHA1(CONCAT_WS('|', ...))
+	return hashlib.sha1("|".join(values).encode()).hexdigest()
+
+
+def update_score_aggregates(summaries):
+	"""Folds freshly written Scheduled Job summaries into the Score Board aggregates.
+
+	Work Item Cycle Score keeps the best score per (work_item, report_cycle, assignee), Work Item
+	Score Aggregate keeps the sum and count of those per (assignee, report_cycle).
+	"""
+	best = {}
+	for summary in summaries:
+		if summary.get("action") != "Scheduled Job":
+			continue
+		key = (summary.get("work_item"), summary.get("report_cycle"), summary.get("assignee"))
+		if not all(key):
+			continue
+		score = flt(summary.get("score"))
+		best[key] = max(best.get(key, score), score)
+	if not best:
+		return
+
+	now = now_datetime()
+	user = frappe.session.user
+	keys = {get_key_name(*key): key for key in best}
+	rows = {name: (name, now, now, user, user, *key, best[key]) for name, key in keys.items()}
+
+	# Only names with a row are locked, a locking read of a missing name takes a gap lock and two
+	# writers holding the same gap deadlock on their inserts. The rest are inserted, and a name
+	# another writer created since this transaction's snapshot fails the insert as a duplicate.
+	current = lock_cycle_scores(
+		frappe.db.sql(
+			"SELECT name FROM `tabWork Item Cycle Score` WHERE name IN %(names)s",
+			{"names": list(rows)},
+			pluck=True,
+		)
+	)
+	inserted = [name for name in sorted(rows) if name not in current]
+	if inserted and not insert_cycle_scores([rows[name] for name in inserted]):
+		names, inserted = inserted, []
+		for name in names:
+			if insert_cycle_scores([rows[name]]):
+				inserted.append(name)
+			else:
+				current.update(lock_cycle_scores([name]))
+
+	improved = []
+	deltas = defaultdict(lambda: [0.0, 0])
+	for name in inserted:
+		_work_item, report_cycle, assignee = keys[name]
+		deltas[(assignee, report_cycle)][0] += best[keys[name]]
+		deltas[(assignee, report_cycle)][1] += 1
+	for name, max_score in current.items():
+		_work_item, report_cycle, assignee = keys[name]
+		if best[keys[name]] > max_score:
+			deltas[(assignee, report_cycle)][0] += best[keys[name]] - max_score
+			improved.append(rows[name])
+
+	if improved:
+		frappe.db.sql(
+			CYCLE_SCORE_INSERT.format(", ".join(["%s"] * len(improved)))
+			+ "ON DUPLICATE KEY UPDATE max_score = GREATEST(max_score, VALUES(max_score)), "
+			+ "modified = VALUES(modified)",
+			improved,
+		)
+
+	if deltas:
+		aggregates = [
+			(get_key_name(assignee, report_cycle), now, now, user, user, assignee, report_cycle, total, count)
+			for (assignee, report_cycle), (total, count) in deltas.items()
+		]
+		frappe.db.sql(
+			"""
+			INSERT INTO `tabWork Item Score Aggregate`
+				(name, creation, modified, owner, modified_by, assignee, report_cycle, total_score, work_item_count)
+			VALUES {}
+			ON DUPLICATE KEY UPDATE
+				total_score = total_score + VALUES(total_score),
+				work_item_count = work_item_count + VALUES(work_item_count),
+				modified = VALUES(modified)
+			""".format(", ".join(["%s"] * len(aggregates))),
+			aggregates,
+		)
+
+
+def lock_cycle_scores(names):
+	# {name: max_score} of existing Work Item Cycle Score rows, locked for this transaction
+	if not names:
+		return {}
+	return {
+		name: flt(max_score)
+		for name, max_score in frappe.db.sql(
+			"SELECT name, max_score FROM `tabWork Item Cycle Score` WHERE name IN %(names)s FOR UPDATE",
+			{"names": list(names)},
+		)
+	}
+
+
+def insert_cycle_scores(rows):
+	# False when one of the names already has a row, nothing is inserted then
+	frappe.db.savepoint(CYCLE_SCORE_SAVEPOINT)
+	try:
+		frappe.db.sql(CYCLE_SCORE_INSERT.format(", ".join(["%s"] * len(rows))), rows)
+	except Exception as e:
+		if not frappe.db.is_duplicate_entry(e):
+			raise
+		frappe.db.rollback(save_point=CYCLE_SCORE_SAVEPOINT)
+		return False
+	frappe.db.release_savepoint(CYCLE_SCORE_SAVEPOINT)
+	return True
+
+
+def get_user_cycle_stats(cycle_dates, users=None):
+	# {assignee: {cycle: {"total": float, "count": int}}}, one row per user and cycle, limited to
+	# `users` when given
+	user_cycle_stats = defaultdict(dict)
+	if not cycle_dates or (users is not None and not users):
+		return user_cycle_stats
+	filters = {"report_cycle": ("in", cycle_dates)}
+	if users is not None:
+		filters["assignee"] = ("in", list(users))
+	for row in frappe.get_all(
+		"Work Item Score Aggregate",
+		filters=filters,
+		fields=["assignee", "report_cycle", "total_score", "work_item_count"],
+	):
+		user_cycle_stats[row.assignee][row.report_cycle] = {
+			"total": flt(row.total_score),
+			"count": row.work_item_count or 0,
+		}
+	return user_cycle_stats
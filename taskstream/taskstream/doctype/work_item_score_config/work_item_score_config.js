@@ -0,0 +1,8 @@
+// Copyright (c) 2026, Chethan - Aerele and contributors
+// For license information, please see license.txt
+
+// frappe.ui.form.on("Work Item Score Config", {
+// 	refresh(frm) {
+
+// 	},
+// });
@@ -1,8 +1,15 @@
 // Copyright (c) 2026, Chethan - Aerele and contributors
 // For license information, please see license.txt
 
-// frappe.ui.form.on("Work Item Score Summary", {
-// 	refresh(frm) {
-
-// 	},
-// });
+frappe.ui.form.on("Work Item Score Summary", {
+	refresh(frm) {
+		if (!frm.doc.score_config) return;
+		frappe.call({
+			method: "taskstream.taskstream.doctype.work_item.work_item.get_score_summary_html",
+			args: { doctype: frm.doctype, docname: frm.doc.name },
+			callback: (r) => {
+				frm.set_df_property("summary_html", "options", r.message || "");
+			},
+		});
+	},
+});
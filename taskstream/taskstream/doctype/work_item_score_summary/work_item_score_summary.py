@@ -1,23 +1,122 @@
 # Copyright (c) 2026, Chethan - Aerele and contributors
 # For license information, please see license.txt
 
+from contextlib import contextmanager
+
 import frappe
 from frappe.model.document import Document
+from frappe.model.naming import parse_naming_series
 from frappe.utils import now_datetime
 
 from taskstream.api import get_reporting_window
+from taskstream.taskstream.bulk import reserve_names
+from taskstream.taskstream.doctype.work_item_score_aggregate.work_item_score_aggregate import (
+	update_score_aggregates,
+)
+from taskstream.taskstream.score_board_cache import invalidate_score_board
+
+SUMMARY_SERIES = "WISS-.YYYY.-"
+SUMMARY_BATCH_SIZE = 500
+
+BREAKDOWN_FIELDS = (
+	"target_end_date",
+	"actual_end_date",
+	"rework_count",
+	"revision_count",
+	"benefit_of_work_done",
+	"delay_minutes",
+	"delay_penalty",
+	"rework_penalty",
+	"revision_penalty",
+	"benefit_penalty",
+	"score_config",
+)
+
+SUMMARY_FIELDS = ("work_item", "assignee", "score", "action", "created_on", "report_cycle", *BREAKDOWN_FIELDS)
 
 
 class WorkItemScoreSummary(Document):
 	pass
 
 
-def create_summary_record(summary, wi, score, action):
-	summary_doc = frappe.new_doc("Work Item Score Summary")
-	summary_doc.work_item = wi
-	summary_doc.summary = summary
-	summary_doc.score = score
-	summary_doc.action = action
-	summary_doc.created_on = now_datetime()
-	summary_doc.report_cycle = get_reporting_window()
-	summary_doc.insert(ignore_permissions=True)
+def on_doctype_update():
+	# cycle scores of one Work Item in the Work Item Report
+	frappe.db.add_index("Work Item Score Summary", ["work_item", "action", "report_cycle"])
+	# cycle scores per assignee in the Work Item Score Board
+	frappe.db.add_index("Work Item Score Summary", ["assignee", "report_cycle", "action"])
+	frappe.db.add_index("Work Item Score Summary", ["report_cycle", "action"])
+
+
+class ScoreSummaryWriter:
+	"""Buffers Work Item Score Summary rows and writes them with multi-row inserts.
+
+	The reporting window is read once per writer, rows are flushed every `batch_size` records and
+	on `flush()`. Controller hooks are not run, so `assignee` is copied here instead of fetched.
+	"""
+
+	def __init__(self, report_cycle=None, batch_size=SUMMARY_BATCH_SIZE):
+		self.report_cycle = report_cycle or get_reporting_window()
+		self.batch_size = batch_size
+		self.rows = []
+
+	def add(self, work_item, action):
+		self.rows.append(
+			(
+				work_item.name,
+				work_item.assignee,
+				work_item.score,
+				action,
+				now_datetime(),
+				self.report_cycle,
+				*(work_item.get(fieldname) for fieldname in BREAKDOWN_FIELDS),
+			)
+		)
+		if len(self.rows) >= self.batch_size:
+			self.flush()
+
+	def flush(self):
+		if not self.rows:
+			return
+
+		names = reserve_names(parse_naming_series(SUMMARY_SERIES), len(self.rows))
+		now = now_datetime()
+		user = frappe.session.user
+		frappe.db.bulk_insert(
+			"Work Item Score Summary",
+			("name", "creation", "modified", "owner", "modified_by", "docstatus", *SUMMARY_FIELDS),
+			[(name, now, now, user, user, 0, *row) for name, row in zip(names, self.rows, strict=True)],
+			chunk_size=self.batch_size,
+		)
+		summaries = [dict(zip(SUMMARY_FIELDS, row, strict=True)) for row in self.rows]
+		update_score_aggregates(summaries)
+		# Only Scheduled Job summaries reach the Score Board aggregates
+		if any(summary["action"] == "Scheduled Job" for summary in summaries):
+			invalidate_score_board()
+		self.rows = []
+
+	def discard(self):
+		# Drop rows buffered for work that was rolled back
+		self.rows = []
+
+
+@contextmanager
+def buffered_summaries(report_cycle=None, batch_size=SUMMARY_BATCH_SIZE):
+	# Every create_summary_record call inside the block goes through one writer
+	previous = frappe.flags.score_summary_writer
+	writer = frappe.flags.score_summary_writer = ScoreSummaryWriter(report_cycle, batch_size)
+	try:
+		yield writer
+		writer.flush()
+	finally:
+		frappe.flags.score_summary_writer = previous
+
+
+def create_summary_record(work_item, action):
+	# work_item is a Work Item doc, or a row of its scoring columns with the breakdown fields set
+	writer = frappe.flags.score_summary_writer
+	if writer:
+		writer.add(work_item, action)
+		return
+
+	writer = ScoreSummaryWriter(batch_size=1)
+	writer.add(work_item, action)
@@ -0,0 +1,47 @@
+# Copyright (c) 2026, Chethan - Aerele and Contributors
+# See license.txt
+
+from datetime import datetime, timedelta
+
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import get_datetime
+
+from taskstream.taskstream.doctype.work_item_slot.work_item_slot import (
+	get_next_slot,
+	get_slots,
+	set_schedule,
+	slot_exists,
+)
+
+MASTER = "WI-SLOT-TEST"
+SLOTS = [datetime(2026, 1, 5, 9), datetime(2026, 1, 6, 9), datetime(2026, 1, 8, 17, 30)]
+
+
+class TestWorkItemSlot(FrappeTestCase):
+	def setUp(self):
+		# Duplicates and unsorted input collapse into one ordered schedule
+		set_schedule(MASTER, [SLOTS[2], SLOTS[0], SLOTS[1], SLOTS[0]])
+
+	def tearDown(self):
+		set_schedule(MASTER, [])
+
+	def test_slot_exists(self):
+		self.assertTrue(slot_exists(MASTER, SLOTS[1]))
+		self.assertFalse(slot_exists(MASTER, SLOTS[1] + timedelta(minutes=1)))
+		self.assertFalse(slot_exists("WI-SLOT-OTHER", SLOTS[1]))
+
+	def test_next_slot(self):
+		self.assertEqual(get_datetime(get_next_slot(MASTER, SLOTS[0] - timedelta(days=1))), SLOTS[0])
+		self.assertEqual(get_datetime(get_next_slot(MASTER, SLOTS[0])), SLOTS[1])
+		self.assertEqual(get_datetime(get_next_slot(MASTER, SLOTS[1] + timedelta(hours=1))), SLOTS[2])
+		self.assertIsNone(get_next_slot(MASTER, SLOTS[2]))
+
+	def test_slots_between(self):
+		# After is exclusive and until inclusive, the materializer's cursor is the last slot created
+		self.assertEqual([get_datetime(s) for s in get_slots(MASTER, SLOTS[0], SLOTS[2])], SLOTS[1:])
+		self.assertEqual(get_slots(MASTER, SLOTS[2], SLOTS[2] + timedelta(days=30)), [])
+
+	def test_set_schedule_replaces_slots(self):
+		set_schedule(MASTER, [SLOTS[2]])
+		self.assertFalse(slot_exists(MASTER, SLOTS[0]))
+		self.assertEqual(get_datetime(get_next_slot(MASTER, SLOTS[0])), SLOTS[2])
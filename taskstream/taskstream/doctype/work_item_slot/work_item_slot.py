@@ -0,0 +1,56 @@
+# Copyright (c) 2026, Chethan - Aerele and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import now_datetime
+
+from taskstream.taskstream.bulk import BULK_INSERT_CHUNK_SIZE
+
+
+class WorkItemSlot(Document):
+	pass
+
+
+def on_doctype_update():
+	frappe.db.add_index("Work Item Slot", ["work_item", "slot"])
+
+
+def set_schedule(work_item, slots):
+	frappe.db.delete("Work Item Slot", {"work_item": work_item})
+	if not slots:
+		return
+
+	now = now_datetime()
+	user = frappe.session.user
+	frappe.db.bulk_insert(
+		"Work Item Slot",
+		["name", "work_item", "slot", "creation", "modified", "owner", "modified_by"],
+		[
+			(frappe.generate_hash(length=10), work_item, slot, now, now, user, user)
+			for slot in sorted(set(slots))
+		],
+		chunk_size=BULK_INSERT_CHUNK_SIZE,
+	)
+
+
+def slot_exists(work_item, slot):
+	return bool(frappe.db.exists("Work Item Slot", {"work_item": work_item, "slot": slot}))
+
+
+def get_next_slot(work_item, after):
+	return frappe.db.get_value(
+		"Work Item Slot",
+		{"work_item": work_item, "slot": (">", after)},
+		"slot",
+		order_by="slot asc",
+	)
+
+
+def get_slots(work_item, after, until):
+	return frappe.get_all(
+		"Work Item Slot",
+		filters=[["work_item", "=", work_item], ["slot", ">", after], ["slot", "<=", until]],
+		pluck="slot",
+		order_by="slot asc",
+	)
@@ -0,0 +1,85 @@
+# Copyright (c) 2026, Chethan - Aerele and contributors
+# For license information, please see license.txt
+
+from datetime import timedelta
+
+import frappe
+
+from taskstream.taskstream.config import get_config
+
+HOLIDAY_DATES_CACHE_KEY = "taskstream:holiday_dates"
+EMPLOYEE_HOLIDAY_LIST_CACHE_KEY = "taskstream:employee_holiday_list"
+
+SKIP_MAP = {
+	"Holidays": 0,
+	"Weekdays": 4,
+}
+
+
+class WorkingCalendar:
+	"""Shifts dates back to the previous working day without touching the database.
+
+	With `holidays` set, only dates in that set are skipped. Otherwise every weekday after
+	`last_working_weekday` (0 = Monday) is skipped.
+	"""
+
+	def __init__(self, holidays=None, last_working_weekday=6):
+		self.holidays = holidays
+		self.last_working_weekday = last_working_weekday
+
+	def previous_working_day(self, date):
+		if self.holidays is not None:
+			while date in self.holidays:
+				date -= timedelta(days=1)
+			return date
+
+		weekday = date.weekday()
+		if weekday > self.last_working_weekday:
+			date -= timedelta(days=weekday - self.last_working_weekday)
+		return date
+
+
+def get_working_calendar(assignee, settings=None):
+	settings = settings or get_config()
+	skip_type = SKIP_MAP.get(settings.skip_holidays_based_on)
+	if skip_type == 4 and settings.include_saturday:
+		skip_type = 5
+
+	holiday_list = None
+	if skip_type == 0:
+		holiday_list = settings.default_holiday or get_employee_holiday_list(assignee) or None
+		if not holiday_list:
+			skip_type = 5 if settings.include_saturday_nonemp else 4
+
+	if skip_type == 0 and holiday_list and frappe.db.exists("Module Def", "Setup"):
+		return WorkingCalendar(holidays=get_holiday_dates(holiday_list))
+
+	return WorkingCalendar(last_working_weekday=skip_type)
+
+
+def get_holiday_dates(holiday_list):
+	holiday_dates = frappe.cache.hget(HOLIDAY_DATES_CACHE_KEY, holiday_list)
+	if holiday_dates is None:
+		holiday_dates = frozenset(
+			frappe.get_all("Holiday", filters={"parent": holiday_list}, pluck="holiday_date")
+		)
+		frappe.cache.hset(HOLIDAY_DATES_CACHE_KEY, holiday_list, holiday_dates)
+	return holiday_dates
+
+
+def get_employee_holiday_list(user):
+	if not user:
+		return None
+	holiday_list = frappe.cache.hget(EMPLOYEE_HOLIDAY_LIST_CACHE_KEY, user)
+	if holiday_list is None:
+		holiday_list = frappe.db.get_value("Employee", {"user_id": user}, "holiday_list") or ""
+		frappe.cache.hset(EMPLOYEE_HOLIDAY_LIST_CACHE_KEY, user, holiday_list)
+	return holiday_list
+
+
+def clear_holiday_cache(doc, method=None):
+	frappe.cache.hdel(HOLIDAY_DATES_CACHE_KEY, doc.name)
+
+
+def clear_employee_holiday_list_cache(doc=None, method=None):
+	frappe.cache.delete_key(EMPLOYEE_HOLIDAY_LIST_CACHE_KEY)
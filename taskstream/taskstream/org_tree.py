@@ -0,0 +1,180 @@
+# Copyright (c) 2026, Chethan - Aerele and contributors
+# For license information, please see license.txt
+
+from collections import defaultdict
+
+import frappe
+from frappe.utils import now_datetime
+
+from taskstream.taskstream.bulk import BULK_INSERT_CHUNK_SIZE
+from taskstream.taskstream.score_board_cache import invalidate_score_board
+
+ORG_TREE_CACHE_KEY = "taskstream:org_tree"
+ORG_CLOSURE_JOB_ID = "taskstream-org-tree-closure"
+ORG_CLOSURE_VERSION_CACHE_KEY = "taskstream:org_closure_version"
+# Employee fields that change the shape of the tree or who sits in it
+TREE_FIELDS = ("reports_to", "status", "user_id")
+
+
+def get_org_tree():
+	"""Active employees as (employee_to_user, employee_display_by_name, reports_to_by_employee,
+	children_by_manager), shared by every worker through the cache."""
+	org_tree = frappe.cache.get_value(ORG_TREE_CACHE_KEY)
+	if org_tree is None:
+		org_tree = _build_org_tree()
+		frappe.cache.set_value(ORG_TREE_CACHE_KEY, org_tree)
+	return org_tree
+
+
+def get_org_subtree(employee):
+	"""Same shape as get_org_tree, limited to the employee, as the only root, and everyone below
+	them. Read through the closure, so the cost follows the size of the subtree."""
+	meta = frappe.get_meta("Employee")
+	employees = frappe.db.sql(
+		f"""
+		SELECT e.name, e.employee_name, e.user_id, e.company_email, e.personal_email, e.reports_to
+		FROM `tabOrg Tree Closure` c
+		INNER JOIN `tabEmployee` e ON e.name = c.descendant
+		WHERE c.ancestor = %s AND e.status = 'Active'
+		ORDER BY e.`{meta.sort_field or "modified"}` {meta.sort_order or "desc"}
+		""",
+		employee,
+		as_dict=True,
+	)
+	return _index_employees(employees, root=employee)
+
+
+def _build_org_tree():
+	employees = frappe.get_all(
+		"Employee",
+		fields=["name", "employee_name", "user_id", "company_email", "personal_email", "reports_to"],
+		filters={"status": "Active"},
+	)
+	return _index_employees(employees)
+
+
+def _index_employees(employees, root=None):
+	employee_to_user = {}
+	employee_display_by_name = {}
+	reports_to_by_employee = {}
+	children_by_manager = defaultdict(list)
+	for employee in employees:
+		employee_name = employee.get("name")
+		employee_user = employee.get("user_id")
+		employee_display = (
+			employee.get("employee_name")
+			or employee.get("company_email")
+			or employee.get("personal_email")
+			or employee_name
+			or employee_user
+		)
+		reports_to = employee.get("reports_to") if employee_name != root else None
+		if not employee_name:
+			continue
+
+		reports_to_by_employee[employee_name] = reports_to
+		employee_display_by_name[employee_name] = employee_display
+		if employee_user:
+			employee_to_user[employee_name] = employee_user
+		if reports_to:
+			children_by_manager[reports_to].append(employee_name)
+
+	return employee_to_user, employee_display_by_name, reports_to_by_employee, children_by_manager
+
+
+def rebuild_org_closure():
+	# Employee changes bump the version after they commit. One that lands while this job runs cannot
+	# enqueue another (same job id), so the job goes again until it has built the latest version.
+	while True:
+		version = _get_org_closure_version()
+		_write_org_closure()
+		frappe.db.commit()
+		if _get_org_closure_version() == version:
+			return
+
+
+def _write_org_closure():
+	# One row per (ancestor, descendant) pair including the employee itself at depth 0. Walking up
+	# from each employee stops at a missing manager (orphan) or at an employee already on the path
+	# (cycle), which matches the descendant walk the Score Board used to do over children_by_manager.
+	org_tree = _build_org_tree()
+	frappe.cache.set_value(ORG_TREE_CACHE_KEY, org_tree)
+	employee_to_user, _employee_display_by_name, reports_to_by_employee, _children_by_manager = org_tree
+
+	now = now_datetime()
+	user = frappe.session.user
+	rows = []
+	for employee in reports_to_by_employee:
+		ancestor, depth, path = employee, 0, set()
+		while ancestor in reports_to_by_employee and ancestor not in path:
+			path.add(ancestor)
+			rows.append(
+				(
+					frappe.generate_hash(length=10),
+					ancestor,
+					employee,
+					employee_to_user.get(employee),
+					depth,
+					now,
+					now,
+					user,
+					user,
+				)
+			)
+			ancestor, depth = reports_to_by_employee.get(ancestor), depth + 1
+
+	frappe.db.delete("Org Tree Closure")
+	frappe.db.bulk_insert(
+		"Org Tree Closure",
+		[
+			"name",
+			"ancestor",
+			"descendant",
+			"descendant_user",
+			"depth",
+			"creation",
+			"modified",
+			"owner",
+			"modified_by",
+		],
+		rows,
+		chunk_size=BULK_INSERT_CHUNK_SIZE,
+	)
+	invalidate_score_board()
+
+
+def _get_org_closure_version():
+	return frappe.cache.get(frappe.cache.make_key(ORG_CLOSURE_VERSION_CACHE_KEY))
+
+
+def _bump_org_closure_version():
+	frappe.cache.incr(frappe.cache.make_key(ORG_CLOSURE_VERSION_CACHE_KEY))
+
+
+def _delete_org_tree():
+	frappe.cache.delete_value(ORG_TREE_CACHE_KEY)
+
+
+def clear_org_tree_cache():
+	# Again after commit, a read in between could cache the tree from before this transaction
+	_delete_org_tree()
+	frappe.db.after_commit.add(_delete_org_tree)
+	invalidate_score_board()
+	frappe.db.after_commit.add(_bump_org_closure_version)
+	frappe.enqueue(
+		rebuild_org_closure,
+		queue="long",
+		job_id=ORG_CLOSURE_JOB_ID,
+		deduplicate=True,
+		enqueue_after_commit=True,
+	)
+
+
+def on_employee_change(doc, method=None):
+	if method == "on_update" and not any(doc.has_value_changed(field) for field in TREE_FIELDS):
+		# Only display names changed, the closure still holds
+		_delete_org_tree()
+		frappe.db.after_commit.add(_delete_org_tree)
+		invalidate_score_board()
+		return
+	clear_org_tree_cache()
@@ -11,18 +11,12 @@ def work_item_user_condition(user=None):
 		return "1=1"
 
 	escaped_user = frappe.db.escape(user)
-	recurrence_filter = "COALESCE(`tabWork Item`.work_item_type, '')"
 
+	# Work Item Participant rows carry the requester/reporter vs assignee/reviewer rules per item,
+	# so the lookup is a single range on its (user, visibility, work_item) index
 	return (
-		f"(({recurrence_filter} IN ('Recurring Instance', '') AND ("
-		f"`tabWork Item`.requester = {escaped_user} OR "
-		f"`tabWork Item`.assignee = {escaped_user} OR "
-		f"`tabWork Item`.reviewer = {escaped_user} OR "
-		f"`tabWork Item`.reporter = {escaped_user}"
-		f")) OR ({recurrence_filter} NOT IN ('Recurring Instance', '') AND ("
-		f"`tabWork Item`.requester = {escaped_user} OR "
-		f"`tabWork Item`.reporter = {escaped_user}"
-		f")))"
+		"`tabWork Item`.name IN (SELECT wip.work_item FROM `tabWork Item Participant` wip "
+		f"WHERE wip.user = {escaped_user} AND wip.visibility IN ('Owner', 'Participant'))"
 	)
 
 
@@ -37,12 +31,14 @@ def work_item_time_extension_user_condition(user=None):
 
 	escaped_user = frappe.db.escape(user)
 
-	approver_exists = (
-		"EXISTS (SELECT 1 FROM `tabApproval User` au "
-		"WHERE au.parenttype = 'Work Item Time Extension' "
-		"AND au.parentfield = 'approver' "
-		"AND au.parent = `tabWork Item Time Extension`.name "
-		f"AND au.user = {escaped_user})"
+	approver_of = (
+		"SELECT au.parent FROM `tabApproval User` au "
+		f"WHERE au.user = {escaped_user} "
+		"AND au.parenttype = 'Work Item Time Extension' "
+		"AND au.parentfield = 'approver'"
 	)
 
-	return f"(`tabWork Item Time Extension`.requester = {escaped_user} OR {approver_exists})"
+	return (
+		f"(`tabWork Item Time Extension`.requester = {escaped_user} "
+		f"OR `tabWork Item Time Extension`.name IN ({approver_of}))"
+	)
@@ -0,0 +1,185 @@
+# Copyright (c) 2026, Chethan - Aerele and contributors
+# For license information, please see license.txt
+
+import calendar
+from datetime import date, timedelta
+from itertools import count
+
+DAYS_MAP = {
+	"Monday": 0,
+	"Tuesday": 1,
+	"Wednesday": 2,
+	"Thursday": 3,
+	"Friday": 4,
+	"Saturday": 5,
+	"Sunday": 6,
+}
+
+WEEK_ORDER_MAP = {"First": 1, "Second": 2, "Third": 3, "Fourth": 4, "Last": 5}
+
+MONTH_MAP = {
+	"January": 1,
+	"February": 2,
+	"March": 3,
+	"April": 4,
+	"May": 5,
+	"June": 6,
+	"July": 7,
+	"August": 8,
+	"September": 9,
+	"October": 10,
+	"November": 11,
+	"December": 12,
+}
+
+
+def parse_recurrence_time(recurrence_time):
+	try:
+		if isinstance(recurrence_time, str) and ":" in recurrence_time:
+			t = recurrence_time.split(":")
+			return timedelta(hours=int(t[0]), minutes=int(t[1]), seconds=0)
+		else:
+			return timedelta(hours=int(recurrence_time))
+	except (ValueError, TypeError, IndexError):
+		return timedelta(hours=0)
+
+
+def nth_weekday(year, month, weekday, occurrence):
+	# weekday is 0 (Monday) - 6 (Sunday), occurrence is 1 - 4 or 5 for the last one in the month
+	first_weekday, last_day = calendar.monthrange(year, month)
+	day = 1 + (weekday - first_weekday) % 7
+	if occurrence <= 4:
+		day += 7 * (occurrence - 1)
+	else:
+		day += 7 * 3
+		if day + 7 <= last_day:
+			day += 7
+	return None if day > last_day else date(year, month, day)
+
+
+class RecurrenceRule:
+	"""Recurrence options of a Work Item compiled into an occurrence generator.
+
+	`occurrences` yields `(date, timedelta)` slots lazily, in the same order and with the same
+	boundaries as the original day-by-day expansion in `_get_valid_dates`.
+	"""
+
+	def __init__(
+		self,
+		recurrence_type,
+		frequency=1,
+		times=(),
+		weekdays=(),
+		monthly_based_on=None,
+		dates=(),
+		day_occurrences=(),
+		months=(),
+	):
+		self.recurrence_type = recurrence_type
+		self.frequency = int(frequency or 1)
+		self.times = list(times)
+		self.weekdays = {DAYS_MAP[d] for d in weekdays if d in DAYS_MAP}
+		self.monthly_based_on = monthly_based_on
+		self.dates = list(dates)
+		self.day_occurrences = [
+			(DAYS_MAP.get(weekday), WEEK_ORDER_MAP.get(order)) for order, weekday in day_occurrences
+		]
+		self.months = [MONTH_MAP.get(m) for m in months]
+
+	@classmethod
+	def from_doc(cls, doc):
+		return cls(
+			doc.recurrence_type,
+			frequency=doc.recurrence_frequency,
+			times=[parse_recurrence_time(t.recurrence_time) for t in doc.recurrence_time],
+			weekdays=[d.weekday for d in doc.recurrence_day],
+			monthly_based_on=doc.monthly_recurrence_based_on,
+			dates=[d.recurrence_date for d in doc.recurrence_date],
+			day_occurrences=[(row.week_order, row.weekday) for row in doc.recurrence_day_occurrence],
+			months=[m.month for m in doc.recurrence_month],
+		)
+
+	def occurrences(self, start_date, end_date):
+		generator = {
+			"Daily": self._daily,
+			"Weekly": self._weekly,
+			"Monthly": self._monthly,
+			"Yearly": self._yearly,
+		}.get(self.recurrence_type)
+		if not generator or not self.times:
+			return iter(())
+		return generator(start_date, end_date)
+
+	def _daily(self, start_date, end_date):
+		step = timedelta(days=self.frequency)
+		current_date = start_date
+		while current_date <= end_date:
+			for time_delta in self.times:
+				yield current_date, time_delta
+			current_date += step
+
+	def _weekly(self, start_date, end_date):
+		offsets = [
+			timedelta(days=offset)
+			for offset in range(7)
+			if (start_date.weekday() + offset) % 7 in self.weekdays
+		]
+		if not offsets:
+			return
+		step = timedelta(weeks=self.frequency)
+		week_start = start_date
+		while week_start <= end_date:
+			for offset in offsets:
+				current_date = week_start + offset
+				if current_date > end_date:
+					return
+				for time_delta in self.times:
+					yield current_date, time_delta
+			week_start += step
+
+	def _monthly(self, start_date, end_date):
+		if self.monthly_based_on == "Date":
+			get_dates = self._month_dates
+		elif self.monthly_based_on == "Day":
+			get_dates = self._month_day_occurrences
+		else:
+			return
+
+		for period in count():
+			month_index = start_date.month - 1 + period * self.frequency
+			year, month = start_date.year + month_index // 12, month_index % 12 + 1
+			if date(year, month, 1) > end_date:
+				return
+			seen = set()
+			for generated_date in get_dates(year, month):
+				if not start_date < generated_date <= end_date:
+					continue
+				for time_delta in self.times:
+					slot = (generated_date, time_delta)
+					if slot not in seen:
+						seen.add(slot)
+						yield slot
+
+	def _month_dates(self, year, month):
+		last_day = calendar.monthrange(year, month)[1]
+		for day in self.dates:
+			yield date(year, month, min(day, last_day))
+
+	def _month_day_occurrences(self, year, month):
+		for weekday, occurrence in self.day_occurrences:
+			yield nth_weekday(year, month, weekday, occurrence)
+
+	def _yearly(self, start_date, end_date):
+		days = [int(d) for d in self.dates]
+		for year in range(start_date.year, end_date.year + 1, self.frequency):
+			for month in self.months:
+				last_day = calendar.monthrange(year, month)[1]
+				for day in days:
+					generated_date = date(year, month, min(day, last_day))
+					if start_date < generated_date <= end_date:
+						for time_delta in self.times:
+							yield generated_date, time_delta
+
+
+def compile_rule(doc):
+	return RecurrenceRule.from_doc(doc)
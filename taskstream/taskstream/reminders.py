@@ -0,0 +1,200 @@
+# Copyright (c) 2026, Chethan - Aerele and contributors
+# For license information, please see license.txt
+
+from datetime import datetime, timedelta
+
+import frappe
+from frappe.utils import get_datetime, get_url, now_datetime
+
+from taskstream.taskstream import send_notifications
+
+# One sorted set per reminder kind: member is the Work Item name, score is when it is due
+TIMER_CACHE_KEY = "taskstream:reminder_timers"
+TIMERS_READY_CACHE_KEY = "taskstream:reminder_timers_ready"
+# Reminders that fell due this long before a rebuild are still sent
+REBUILD_LOOKBACK = timedelta(days=1)
+CLAIM_BATCH_SIZE = 500
+REMINDER_STATUSES = ("Open", "In Progress", "Rework Needed")
+EPOCH = datetime(1970, 1, 1)
+
+REMINDERS = {
+	"twenty_percent": frappe._dict(
+		due_field="twenty_percent_reminder_time",
+		sent_field="twenty_percent_reminder_sent",
+		message="You're at 20% remaining time for the Work Item <b>{name}</b>. Please plan accordingly.",
+	),
+	"deadline": frappe._dict(
+		due_field="target_end_date",
+		sent_field="deadline_reminder_sent",
+		message="The deadline is met for the Work Item <b>{name}</b>, but it is still open. Please review it.",
+	),
+}
+
+
+def dispatch_reminders(kind):
+	reminder = REMINDERS[kind]
+	ensure_reminder_timers()
+	now = now_datetime()
+	names = pop_due_timers(kind, now)
+
+	for start in range(0, len(names), CLAIM_BATCH_SIZE):
+		batch = names[start : start + CLAIM_BATCH_SIZE]
+		try:
+			work_items = claim_reminders(kind, reminder, batch, now)
+			if work_items:
+				frappe.enqueue(
+					deliver_reminders,
+					queue="short",
+					enqueue_after_commit=True,
+					kind=kind,
+					work_items=work_items,
+				)
+			frappe.db.commit()
+		except Exception as e:
+			frappe.db.rollback()
+			# Put the batch back so the next run picks it up again
+			_add_timers(kind, {name: _get_score(now) for name in batch})
+			frappe.log_error(
+				message=f"Error claiming {kind} reminders: {e!s}",
+				title="Work Item Reminder Error",
+			)
+
+
+def claim_reminders(kind, reminder, names, now):
+	# The timer can be stale when a save was rolled back, the row is the source of truth
+	rows = frappe.db.sql(
+		f"""
+		SELECT name, assignee, status, `{reminder.due_field}` AS due, `{reminder.sent_field}` AS sent
+		FROM `tabWork Item`
+		WHERE name IN %(names)s
+		FOR UPDATE
+		""",
+		{"names": names},
+		as_dict=True,
+	)
+
+	work_items, rescheduled = [], {}
+	for row in rows:
+		if row.sent or row.status not in REMINDER_STATUSES or not row.due:
+			continue
+		due = get_datetime(row.due)
+		if due > now:
+			rescheduled[row.name] = _get_score(due)
+		else:
+			work_items.append(frappe._dict(name=row.name, assignee=row.assignee))
+
+	if work_items:
+		frappe.db.sql(
+			f"UPDATE `tabWork Item` SET `{reminder.sent_field}` = 1 WHERE name IN %(names)s",
+			{"names": [row.name for row in work_items]},
+		)
+	if rescheduled:
+		_add_timers(kind, rescheduled)
+	return work_items
+
+
+def deliver_reminders(kind, work_items):
+	reminder = REMINDERS[kind]
+	url = get_url()
+	for row in work_items:
+		if not row.get("assignee"):
+			continue
+		content = (
+			reminder.message.format(name=row["name"])
+			+ f"<br><a href='{url}/app/work-item/{row['name']}'>View Work Item</a>"
+		)
+		try:
+			send_notifications(row["name"], content, [row["assignee"]])
+		except Exception as e:
+			frappe.log_error(
+				message=f"Error sending {kind} reminder for {row['name']}: {e!s}",
+				title="Work Item Reminder Error",
+			)
+
+
+def schedule_reminders(work_items):
+	# Timers are written once the transaction commits, a rolled back save leaves them untouched
+	timers = {kind: {} for kind in REMINDERS}
+	removed = {kind: [] for kind in REMINDERS}
+	for work_item in work_items:
+		for kind, reminder in REMINDERS.items():
+			due = work_item.get(reminder.due_field)
+			if due and not work_item.get(reminder.sent_field) and work_item.status in REMINDER_STATUSES:
+				timers[kind][work_item.name] = _get_score(get_datetime(due))
+			else:
+				removed[kind].append(work_item.name)
+
+	def _write():
+		for kind in REMINDERS:
+			_add_timers(kind, timers[kind])
+			_remove_timers(kind, removed[kind])
+
+	frappe.db.after_commit.add(_write)
+
+
+def pop_due_timers(kind, now):
+	# ZRANGEBYSCORE and ZREMRANGEBYSCORE in one MULTI, a member is only ever handed to one worker
+	key = _get_timer_key(kind)
+	pipeline = frappe.cache.pipeline()
+	pipeline.zrangebyscore(key, "-inf", _get_score(now))
+	pipeline.zremrangebyscore(key, "-inf", _get_score(now))
+	names, _removed = pipeline.execute()
+	return [frappe.safe_decode(name) for name in names]
+
+
+def ensure_reminder_timers():
+	if not frappe.cache.get_value(TIMERS_READY_CACHE_KEY):
+		rebuild_reminder_timers()
+
+
+def rebuild_reminder_timers():
+	since = now_datetime() - REBUILD_LOOKBACK
+	for kind, reminder in REMINDERS.items():
+		frappe.cache.pipeline().delete(_get_timer_key(kind)).execute()
+		# Keyset on (due, name) so each page is a range read on the (sent, due) index
+		last_due, last_name = since, ""
+		while True:
+			rows = frappe.db.sql(
+				f"""
+				SELECT name, `{reminder.due_field}` AS due
+				FROM `tabWork Item`
+				WHERE `{reminder.sent_field}` = 0
+					AND `{reminder.due_field}` >= %(last_due)s
+					AND (`{reminder.due_field}` > %(last_due)s OR name > %(last_name)s)
+					AND status IN %(statuses)s
+				ORDER BY `{reminder.due_field}`, name
+				LIMIT %(limit)s
+				""",
+				{
+					"statuses": REMINDER_STATUSES,
+					"last_due": last_due,
+					"last_name": last_name,
+					"limit": CLAIM_BATCH_SIZE,
+				},
+				as_dict=True,
+			)
+			if not rows:
+				break
+			_add_timers(kind, {row.name: _get_score(get_datetime(row.due)) for row in rows})
+			last_due, last_name = rows[-1].due, rows[-1].name
+
+	frappe.cache.set_value(TIMERS_READY_CACHE_KEY, 1)
+
+
+def _add_timers(kind, timers):
+	if timers:
+		frappe.cache.pipeline().zadd(_get_timer_key(kind), timers).execute()
+
+
+def _remove_timers(kind, names):
+	if names:
+		frappe.cache.pipeline().zrem(_get_timer_key(kind), *names).execute()
+
+
+def _get_timer_key(kind):
+	# Pipelines bypass the cache wrapper, so the site prefix is added here
+	return frappe.cache.make_key(f"{TIMER_CACHE_KEY}:{kind}")
+
+
+def _get_score(value):
+	return (value - EPOCH).total_seconds()
@@ -3,6 +3,31 @@
 
 frappe.query_reports["Work Item Report"] = {
 	filters: [
+		{
+			fieldname: "assignee",
+			label: __("Assignee"),
+			fieldtype: "Link",
+			options: "User",
+		},
+		{
+			fieldname: "status",
+			label: __("Status"),
+			fieldtype: "Select",
+			options: "\nTo Do\nOpen\nIn Progress\nUnder Review\nDone\nOn Hold\nRework Needed",
+		},
+		{
+			fieldname: "reference",
+			label: __("Reference"),
+			fieldtype: "Link",
+			options: "Work Item",
+		},
+		{
+			// (target_end_date, name) cursor of the last row of the previous page
+			fieldname: "after",
+			label: __("After"),
+			fieldtype: "Data",
+			hidden: 1,
+		},
 		// {
 		// 	fieldname: "reporting_period",
 		// 	label: __("Reporting Period"),
@@ -30,4 +55,23 @@ frappe.query_reports["Work Item Report"] = {
 		// 	depends_on: "eval: doc.reporting_period == 'Custom'",
 		// },
 	],
+	onload(report) {
+		report.page.add_inner_button(__("First Page"), () => {
+			report.set_filter_value("after", "");
+		});
+		report.page.add_inner_button(__("Next Page"), () => {
+			const data = report.data || [];
+			const last = data[data.length - 1];
+			if (!last) return;
+			report.set_filter_value("after", `${last.target_date}|${last.work_item}`);
+		});
+		report.page.add_inner_button(__("Export CSV"), () => {
+			const filters = report.get_filter_values();
+			delete filters.after;
+			window.open(
+				"/api/method/taskstream.taskstream.report.work_item_report.work_item_report.export_work_item_report" +
+					`?filters=${encodeURIComponent(JSON.stringify(filters))}`
+			);
+		});
+	},
 };
@@ -1,17 +1,37 @@
 # Copyright (c) 2026, Chethan - Aerele and contributors
 # For license information, please see license.txt
 
+import csv
+import heapq
+import io
+from collections import defaultdict
 from datetime import datetime, time
+from itertools import islice
 
 import frappe
 from frappe.query_builder import DocType
-from frappe.utils import add_days, get_datetime, now_datetime
+from frappe.utils import add_days, cint, get_datetime, getdate, now_datetime
+from werkzeug.wrappers import Response
 
 from taskstream.api import get_cycles
+from taskstream.taskstream.config import get_config
+
+SUMMARY_CHUNK_SIZE = 1000
+PAGE_SIZE = 500
+EXPORT_BUFFER_SIZE = 64 * 1024
 
 
 def execute(filters=None):
-	no_of_cycles_in_report = frappe.get_doc("Work Item Configuration", "Work Item Configuration")
+	no_of_cycles_in_report, cycle_dates = _get_cycle_dates()
+
+	filters = filters or {}
+	columns = get_columns(cycle_dates)
+	data = get_data(filters, cycle_dates, no_of_cycles_in_report.no_of_cycles_in_report)
+	return columns, data
+
+
+def _get_cycle_dates():
+	no_of_cycles_in_report = get_config()
 	if (
 		no_of_cycles_in_report.last_executed_on is None
 		or no_of_cycles_in_report.no_of_cycles_in_report == 0
@@ -25,11 +45,7 @@ def execute(filters=None):
 		no_of_cycles_in_report.no_of_cycles_in_report,
 		no_of_cycles_in_report.starting_date,
 	)
-
-	filters = filters or {}
-	columns = get_columns(cycle_dates)
-	data = get_data(filters, cycle_dates, no_of_cycles_in_report.no_of_cycles_in_report)
-	return columns, data
+	return no_of_cycles_in_report, cycle_dates
 
 
 def get_columns(cycle_dates):
@@ -50,43 +66,85 @@ def get_columns(cycle_dates):
 
 
 def get_data(filters=None, cycle_dates=None, no_of_cycles=0):
-	filters = filters or {}
-	no_of_cycles_in_report = frappe.get_doc("Work Item Configuration", "Work Item Configuration")
-	start_dt, end_dt = _get_window(
+	# One page per run, the "after" filter holds the (target_end_date, name) cursor of the last row
+	filters = frappe._dict(filters or {})
+	rows = get_work_item_page(
 		filters,
-		no_of_cycles_in_report.last_executed_on,
-		no_of_cycles_in_report.reporting_frequency,
+		_get_report_window(filters),
+		after=_parse_cursor(filters.get("after")),
+		limit=cint(filters.get("page_size")) or PAGE_SIZE,
 	)
-	# reporting_type = filters.get("reporting_type") or "Upcoming"
+	return _build_rows(rows, cycle_dates, no_of_cycles)
 
-	work_item = DocType("Work Item")
-	work_item_summary = DocType("Work Item Score Summary")
 
-	base_query = frappe.qb.from_(work_item).select(
-		work_item.name.as_("work_item"),
-		work_item.summary,
-		work_item.assignee,
-		work_item.status,
-		work_item.reference_document,
-		work_item.reference_doctype,
-		work_item.benefit_of_work_done,
-		work_item.target_end_date.as_("target_date"),
-		work_item.actual_end_date.as_("actual_end"),
-	)
+def iter_report_rows(filters, cycle_dates, no_of_cycles, page_size=PAGE_SIZE):
+	# Walks every page of the window, only one page is held in memory at a time
+	filters = frappe._dict(filters or {})
+	window = _get_report_window(filters)
+	after = None
+	while rows := get_work_item_page(filters, window, after=after, limit=page_size):
+		yield from _build_rows(rows, cycle_dates, no_of_cycles)
+		after = (rows[-1].target_date, rows[-1].work_item)
 
-	# query_open = base_query.where(work_item.target_end_date.between(start_dt, end_dt)).where(
-	# 	work_item.status != "Done"
-	# )
-	query_open = base_query.where(work_item.target_end_date < end_dt).where(work_item.status != "Done")
 
-	query_done = base_query.where(work_item.actual_end_date.between(start_dt, end_dt)).where(
-		work_item.status == "Done"
-	)
+def get_work_item_page(filters, window, after=None, limit=PAGE_SIZE):
+	# Open and Done rows come from separate keyset queries, merged on (target_end_date, name)
+	pages = [query.run(as_dict=True) for query in get_work_item_page_queries(filters, window, after, limit)]
+	return list(islice(heapq.merge(*pages, key=lambda row: (row.target_date, row.work_item)), limit))
+
+
+def get_work_item_page_queries(filters, window, after=None, limit=PAGE_SIZE):
+	# One query per branch of the window so each can range over its own index: open rows on
+	# (status, target_end_date), Done rows on (status, actual_end_date) within the window
+	start_dt, end_dt = window
+	work_item = DocType("Work Item")
+	branches = []
+	if filters.get("status") != "Done":
+		branches.append((work_item.status != "Done") & (work_item.target_end_date < end_dt))
+	if filters.get("status") in (None, "", "Done"):
+		branches.append((work_item.status == "Done") & work_item.actual_end_date.between(start_dt, end_dt))
+
+	queries = []
+	for branch in branches:
+		query = (
+			frappe.qb.from_(work_item)
+			.select(
+				work_item.name.as_("work_item"),
+				work_item.summary,
+				work_item.assignee,
+				work_item.status,
+				work_item.reference_document,
+				work_item.reference_doctype,
+				work_item.benefit_of_work_done,
+				work_item.target_end_date.as_("target_date"),
+				work_item.actual_end_date.as_("actual_end"),
+			)
+			.where(work_item.target_end_date.isnotnull())
+			.where(branch)
+		)
+		if filters.get("assignee"):
+			query = query.where(work_item.assignee == filters.assignee)
+		if filters.get("status"):
+			query = query.where(work_item.status == filters.status)
+		if filters.get("reference"):
+			query = query.where(work_item.reference_doctype == "Work Item").where(
+				work_item.reference_document == filters.reference
+			)
+		if after:
+			target_date, name = after
+			query = query.where(work_item.target_end_date >= target_date).where(
+				(work_item.target_end_date > target_date) | (work_item.name > name)
+			)
+		queries.append(query.orderby(work_item.target_end_date).orderby(work_item.name).limit(limit))
+	return queries
 
-	open_rows = query_open.orderby(work_item.target_end_date).run(as_dict=True)
-	done_rows = query_done.orderby(work_item.actual_end_date).run(as_dict=True)
 
-	rows = open_rows + done_rows
+def _build_rows(rows, cycle_dates, no_of_cycles):
+	work_items = [row.get("work_item") for row in rows]
+	cycle_scores = (
+		_get_cycle_scores(work_items, cycle_dates, no_of_cycles) if no_of_cycles > 0 and cycle_dates else {}
+	)
+	full_names = _get_full_names({row.get("assignee") for row in rows if row.get("assignee")})
 
 	results = []
 	now = now_datetime()
@@ -105,9 +163,7 @@ def get_data(filters=None, cycle_dates=None, no_of_cycles=0):
 		result_row = {
 			"work_item": row.get("work_item"),
 			"summary": row.get("summary"),
-			"assignee": frappe.get_cached_value("User", row.get("assignee"), "full_name")
-			if row.get("assignee")
-			else None,
+			"assignee": full_names.get(row.get("assignee")) if row.get("assignee") else None,
 			"status": row.get("status"),
 			"reference": reference,
 			"target_date": target_date,
@@ -115,37 +171,100 @@ def get_data(filters=None, cycle_dates=None, no_of_cycles=0):
 			"delay_in_days": delay_days,
 			"benefit_of_work_done": benefit_of_work_done,
 		}
+		result_row.update(cycle_scores.get(row.get("work_item"), {}))
+
+		results.append(result_row)
+
+	return results
+
 
-		# Fetch Work Item Summary records for this work item
-		if no_of_cycles > 0 and cycle_dates:
-			summary_query = (
-				frappe.qb.from_(work_item_summary)
-				.select(
-					work_item_summary.name,
-					work_item_summary.score,
-					work_item_summary.creation,
-					work_item_summary.report_cycle,
+def _get_cycle_scores(work_items, cycle_dates, no_of_cycles):
+	# One query per SUMMARY_CHUNK_SIZE Work Items instead of one per row. Per Work Item only the
+	# first `no_of_cycles` summaries by creation count, a later one wins for the same cycle.
+	work_item_summary = DocType("Work Item Score Summary")
+	cycle_scores = {}
+	seen = defaultdict(int)
+	for start in range(0, len(work_items), SUMMARY_CHUNK_SIZE):
+		summary_records = (
+			frappe.qb.from_(work_item_summary)
+			.select(work_item_summary.work_item, work_item_summary.score, work_item_summary.report_cycle)
+			.where(work_item_summary.work_item.isin(work_items[start : start + SUMMARY_CHUNK_SIZE]))
+			.where(work_item_summary.action == "Scheduled Job")
+			.where(work_item_summary.report_cycle.isnotnull())
+			.where(work_item_summary.report_cycle.isin(cycle_dates))
+			.orderby(work_item_summary.work_item)
+			.orderby(work_item_summary.creation)
+		).run(as_dict=True)
+
+		for summary_record in summary_records:
+			work_item = summary_record.work_item
+			if seen[work_item] >= no_of_cycles:
+				continue
+			seen[work_item] += 1
+			if report_cycle := summary_record.report_cycle:
+				cycle_scores.setdefault(work_item, {})[f"score_{report_cycle}"] = round(
+					summary_record.score or 0, 2
 				)
-				.where(work_item_summary.work_item == row.get("work_item"))
-				.where(work_item_summary.action == "Scheduled Job")
-				.where(work_item_summary.report_cycle.isnotnull())
-				.where(work_item_summary.report_cycle.isin(cycle_dates))
-				.orderby(work_item_summary.creation)
-				.limit(no_of_cycles)
-			)
-			summary_records = summary_query.run(as_dict=True)
 
-			# Map scores to cycle dates
-			for summary_record in summary_records:
-				report_cycle = summary_record.get("report_cycle")
-				if report_cycle:
-					cycle_key = f"score_{report_cycle}"
-					score_val = summary_record.get("score") or 0
-					result_row[cycle_key] = round(score_val, 2)
+	return cycle_scores
 
-		results.append(result_row)
 
-	return results
+def _get_full_names(users):
+	if not users:
+		return {}
+	return dict(
+		frappe.get_all(
+			"User", filters={"name": ("in", list(users))}, fields=["name", "full_name"], as_list=True
+		)
+	)
+
+
+def _get_report_window(filters):
+	no_of_cycles_in_report = get_config()
+	return _get_window(
+		filters,
+		no_of_cycles_in_report.last_executed_on,
+		no_of_cycles_in_report.reporting_frequency,
+	)
+
+
+def _parse_cursor(cursor):
+	if not cursor:
+		return None
+	target_date, name = cursor.split("|", 1)
+	return get_datetime(target_date), name
+
+
+@frappe.whitelist()
+def export_work_item_report(filters=None):
+	if not frappe.get_doc("Report", "Work Item Report").is_permitted():
+		frappe.throw("Not permitted", frappe.PermissionError)
+
+	filters = frappe.parse_json(filters) or {}
+	filters.pop("after", None)
+	no_of_cycles_in_report, cycle_dates = _get_cycle_dates()
+	columns = get_columns(cycle_dates)
+
+	def generate():
+		# Runs while the response is sent, after the request closed its connection; the first
+		# query reconnects and the connection is closed again once the last page is written.
+		buffer = io.StringIO()
+		writer = csv.writer(buffer)
+		try:
+			writer.writerow([column["label"] for column in columns])
+			for row in iter_report_rows(filters, cycle_dates, no_of_cycles_in_report.no_of_cycles_in_report):
+				writer.writerow([row.get(column["fieldname"]) for column in columns])
+				if buffer.tell() >= EXPORT_BUFFER_SIZE:
+					yield buffer.getvalue()
+					buffer.seek(0)
+					buffer.truncate()
+			yield buffer.getvalue()
+		finally:
+			frappe.db.close()
+
+	response = Response(generate(), mimetype="text/csv")
+	response.headers["Content-Disposition"] = 'attachment; filename="Work Item Report.csv"'
+	return response
 
 
 def _get_window(filters, last_executed_on, reporting_frequency=0):
@@ -156,6 +275,6 @@ def _get_window(filters, last_executed_on, reporting_frequency=0):
 	# else:
 	# 	start_date = last_executed_on
 	# 	end_date = add_days(last_executed_on, reporting_frequency - 1)
-	start_dt = datetime.combine(datetime.strptime(start_date, "%Y-%m-%d"), time.min)
-	end_dt = datetime.combine(datetime.strptime(last_executed_on, "%Y-%m-%d"), time.max)
+	start_dt = datetime.combine(getdate(start_date), time.min)
+	end_dt = datetime.combine(getdate(last_executed_on), time.max)
 	return start_dt, end_dt
@@ -14,6 +14,29 @@ frappe.query_reports["Work Item Score Board"] = {
 		}
 		return f;
 	})(),
+	onload(report) {
+		report.page.add_inner_button(__("Team Tree"), () => {
+			const dialog = new frappe.ui.Dialog({
+				title: __("Score Board"),
+				size: "large",
+				fields: [{ fieldname: "tree", fieldtype: "HTML" }],
+			});
+			// Each level is fetched when its node is expanded
+			new frappe.ui.Tree({
+				parent: dialog.fields_dict.tree.$wrapper,
+				label: __("All"),
+				expandable: true,
+				method: "taskstream.taskstream.report.work_item_score_board.work_item_score_board.get_score_board_nodes",
+				args: { filters: report.get_filter_values() },
+				get_label: (node) => {
+					if (node.is_root) return __("All");
+					const title = frappe.utils.escape_html(node.data.title || "");
+					return `${node.data.is_group ? `<strong>${title}</strong>` : title} · ${node.data.score}`;
+				},
+			});
+			dialog.show();
+		});
+	},
 	formatter: function (value, row, column, data, default_formatter) {
 		value = default_formatter(value, row, column, data);
 		if (data && data.is_group) {
@@ -3,26 +3,87 @@
 
 import urllib.parse
 from collections import defaultdict
-from functools import lru_cache
 
 import frappe
+from frappe.desk.query_report import get_report_doc
 from frappe.query_builder import DocType
 from frappe.query_builder.functions import Coalesce, Count, Sum
-from frappe.utils import add_days, get_datetime, getdate, now_datetime
+from frappe.utils import add_days, cint, get_datetime, getdate, now_datetime
 
 from taskstream.api import get_cycles
+from taskstream.taskstream.config import get_config
+from taskstream.taskstream.doctype.work_item_score_aggregate.work_item_score_aggregate import (
+	get_user_cycle_stats,
+)
+from taskstream.taskstream.org_tree import get_org_subtree, get_org_tree
+from taskstream.taskstream.score_board_cache import get_cached_score_board
 
 
 def execute(filters=None):
-	wic = frappe.get_doc("Work Item Configuration", "Work Item Configuration")
+	cycle_dates = get_cycle_dates()
+	columns = get_columns(cycle_dates)
+	data = get_data(filters, cycle_dates)
+	return columns, data
+
+
+def get_cycle_dates():
+	wic = get_config()
 	if wic.last_executed_on is None or wic.no_of_cycles_in_report == 0 or wic.reporting_frequency == 0:
 		frappe.throw("Please Complete the Work Item Configuration setup to run the report.")
-	cycle_dates = get_cycles(
+	return get_cycles(
 		wic.last_executed_on, wic.reporting_frequency, wic.no_of_cycles_in_report, wic.starting_date
 	)
-	columns = get_columns(cycle_dates)
-	data = get_data(filters, cycle_dates)
-	return columns, data
+
+
+@frappe.whitelist()
+def get_score_board_nodes(filters=None, parent=None, is_root=False):
+	# One level of the Score Board tree, children of `parent` or the top level when is_root is set.
+	# Teams are addressed by employee, so an id from before the board changed still means the same
+	# team, or finds no children once the team is gone.
+	get_report_doc("Work Item Score Board")
+	filters = frappe.parse_json(filters) or {}
+	board = get_score_board(filters, get_cycle_dates())
+	rows, children = board["rows"], board["children"]
+	positions = board["roots"] if cint(is_root) or not parent else children.get(parent, [])
+	return [
+		{
+			**rows[position],
+			"value": get_node_id(rows[position]),
+			"title": rows[position].get("user"),
+			"expandable": bool(children.get(get_node_id(rows[position]))),
+			"has_children": bool(children.get(get_node_id(rows[position]))),
+		}
+		for position in positions
+	]
+
+
+def build_score_board(rows):
+	# The rows with their tree index, cached as one entry so the index always matches its rows
+	roots, children = build_tree_index(rows)
+	return {"rows": rows, "roots": roots, "children": children}
+
+
+def build_tree_index(rows):
+	# (top level row positions, {team node id: child row positions}) from the indent of the flat rows
+	roots = []
+	children = {}
+	groups = []
+	for position, row in enumerate(rows):
+		indent = row.get("indent") or 0
+		while groups and (rows[groups[-1]].get("indent") or 0) >= indent:
+			groups.pop()
+		if groups:
+			children.setdefault(get_node_id(rows[groups[-1]]), []).append(position)
+		else:
+			roots.append(position)
+		if row.get("is_group"):
+			groups.append(position)
+	return roots, children
+
+
+def get_node_id(row):
+	# A team is its manager's employee, a user appears once outside of team rows
+	return row.get("employee") if row.get("is_group") else row.get("user_id")
 
 
 def get_columns(cycle_dates):
@@ -42,56 +103,73 @@ def get_columns(cycle_dates):
 
 
 def get_data(filters=None, cycle_dates=None):
+	return get_score_board(filters, cycle_dates)["rows"]
+
+
+def get_score_board(filters=None, cycle_dates=None):
+	# Board of the session user, see build_score_board
 	filters = filters or {}
 	# from_date = filters.get("from_date") or frappe.utils.add_months(frappe.utils.today(), -1)
 	# to_date = filters.get("to_date") or frappe.utils.today()
 	roles = frappe.get_roles(frappe.session.user)
 
-	def _compute_visible_users():
+	def _compute_scope():
+		# (root employee, org subtree, users whose work is queried, user whose rows are shown).
+		# Admins see everyone, or only the rows of the user they pick, which still need that user's
+		# team for the team totals. Everyone else sees their own team.
 		if any(role in ["System Manager", "Work Item Admin"] for role in roles):
-			return None if (filters.get("user") is None) else {filters.get("user")}
+			if filters.get("user") is None:
+				return None, None, None, None
+			return (*get_team(filters.get("user")), filters.get("user"))
+		return (*get_team(frappe.session.user), None)
+
+	root_employee, org_tree, query_users, shown_user = _compute_scope()
+
+	def _compute():
+		rows = get_score_board_rows(org_tree, query_users, cycle_dates)
+		if shown_user is not None:
+			rows = [row for row in rows if row.get("user_id") == shown_user]
+		return build_score_board(rows)
+
+	config = get_config()
+	key_parts = (
+		root_employee,
+		sorted(query_users) if query_users is not None else None,
+		shown_user,
+		cycle_dates,
+		config.last_executed_on,
+		config.version,
+	)
+	return get_cached_score_board(key_parts, _compute)
 
-		current_user = frappe.session.user
 
-		employee_to_user, employee_display_by_name, reports_to_by_employee, children_by_manager = (
-			get_employee_list()
-		)
+def get_score_board_rows(org_tree, query_users, cycle_dates=None):
+	# org_tree is None for the whole company
+	current_datetime = now_datetime()
+	config = get_config()
+	start_dt = add_days(config.last_executed_on, 1)
+	end_dt = add_days(config.last_executed_on, config.reporting_frequency)
+	start_dt = get_datetime(getdate(start_dt))
+	end_dt = get_datetime(getdate(end_dt)).replace(hour=23, minute=59, second=59, microsecond=999999)
 
-		emp_name = frappe.db.get_value("Employee", {"user_id": current_user, "status": "Active"}, "name")
-		if not emp_name:
-			return {current_user}
+	base_rows = get_user_score_query(start_dt, end_dt, current_datetime, query_users).run(as_dict=True)
 
-		stack = [emp_name]
-		descendants = set()
-		while stack:
-			cur = stack.pop()
-			if cur in descendants:
-				continue
-			descendants.add(cur)
-			for c in children_by_manager.get(cur, []):
-				if c not in descendants:
-					stack.append(c)
+	# Per-cycle sums and counts of each Work Item's best score, maintained as summaries are written
+	user_cycle_stats = get_user_cycle_stats(cycle_dates, query_users)
 
-		visible = {current_user}
-		for en in descendants:
-			uid = employee_to_user.get(en)
-			if uid:
-				visible.add(uid)
+	erpnext_with_employee = is_erpnext_installed()
+	rows = (
+		get_hierarchical_scores(base_rows, cycle_dates, user_cycle_stats, org_tree)
+		if erpnext_with_employee
+		else build_average_rows(base_rows, cycle_dates, user_cycle_stats)
+	)
 
-		return visible
+	return rows if erpnext_with_employee else sorted(rows, key=lambda row: row.get("user") or "")
 
-	visible_users = _compute_visible_users()
 
+def get_user_score_query(start_dt, end_dt, current_datetime, query_users=None):
+	# Current score per assignee: Done in the window and overdue Open Work Items
 	work_item = DocType("Work Item")
-	current_datetime = now_datetime()
-	last_executed_on, reporting_frequency = frappe.db.get_value(
-		"Work Item Configuration", "Work Item Configuration", ["last_executed_on", "reporting_frequency"]
-	)
-	start_dt = add_days(last_executed_on, 1)
-	end_dt = add_days(last_executed_on, int(reporting_frequency))
-	start_dt = get_datetime(getdate(start_dt))
-	end_dt = get_datetime(getdate(end_dt)).replace(hour=23, minute=59, second=59, microsecond=999999)
-
 	query = (
 		frappe.qb.from_(work_item)
 		.select(
@@ -106,96 +184,29 @@ def get_data(filters=None, cycle_dates=None):
 		.groupby(work_item.assignee)
 		.orderby(work_item.assignee)
 	)
-
-	base_rows = query.run(as_dict=True)
-
-	# Fetch per-cycle scores from Work Item Score Summary
-	cycle_scores_raw = []
-	if cycle_dates:
-		try:
-			cycle_scores_raw = frappe.get_all(
-				"Work Item Score Summary",
-				filters={"report_cycle": ("in", cycle_dates), "action": "Scheduled Job"},
-				fields=["assignee", "report_cycle", "score", "work_item"],
-			)
-		except Exception:
-			cycle_scores_raw = []
-
-	# Build per-user per-cycle totals and counts
-	user_cycle_wi_scores = defaultdict(lambda: defaultdict(dict))
-	for rec in cycle_scores_raw:
-		assignee = rec.get("assignee")
-		cycle = rec.get("report_cycle")
-		score = rec.get("score") or 0.0
-		work_item = rec.get("work_item")
-
-		if not assignee or not cycle or not work_item:
-			continue
-
-		if work_item not in user_cycle_wi_scores[assignee][cycle]:
-			user_cycle_wi_scores[assignee][cycle][work_item] = score
-		else:
-			user_cycle_wi_scores[assignee][cycle][work_item] = max(
-				user_cycle_wi_scores[assignee][cycle][work_item], score
-			)
-
-	user_cycle_stats = defaultdict(lambda: defaultdict(lambda: {"total": 0.0, "count": 0}))
-	for assignee, cycles in user_cycle_wi_scores.items():
-		for cycle, wi_scores in cycles.items():
-			for max_score in wi_scores.values():
-				user_cycle_stats[assignee][cycle]["total"] += max_score
-				user_cycle_stats[assignee][cycle]["count"] += 1
-
-	erpnext_with_employee = is_erpnext_installed()
-	rows = (
-		get_hierarchical_scores(base_rows, cycle_dates, user_cycle_stats)
-		if erpnext_with_employee
-		else build_average_rows(base_rows, cycle_dates, user_cycle_stats)
-	)
-
-	if visible_users is not None:
-		rows = [row for row in rows if row.get("user_id") in visible_users]
-
-	return rows if erpnext_with_employee else sorted(rows, key=lambda row: row.get("user") or "")
+	if query_users is not None:
+		query = query.where(work_item.assignee.isin(list(query_users)))
+	return query
 
 
 def is_erpnext_installed():
 	return "erpnext" in frappe.get_installed_apps() and frappe.db.exists("DocType", "Employee")
 
 
-@lru_cache(maxsize=1)
-def _fetch_employees_active():
-	employees = frappe.get_all(
-		"Employee",
-		fields=["name", "employee_name", "user_id", "company_email", "personal_email", "reports_to"],
-		filters={"status": "Active"},
-	)
-	employee_to_user = {}
-	employee_display_by_name = {}
-	reports_to_by_employee = {}
-	children_by_manager = defaultdict(list)
-	for employee in employees:
-		employee_name = employee.get("name")
-		employee_user = employee.get("user_id")
-		employee_display = (
-			employee.get("employee_name")
-			or employee.get("company_email")
-			or employee.get("personal_email")
-			or employee_name
-			or employee_user
-		)
-		reports_to = employee.get("reports_to")
-		if not employee_name:
-			continue
+def get_team(user):
+	# (employee, org subtree, users) of the user and everyone reporting to them, directly or not
+	empty_tree = ({}, {}, {}, {})
+	if not is_erpnext_installed():
+		return None, empty_tree, {user}
+	employee = frappe.db.get_value("Employee", {"user_id": user, "status": "Active"}, "name")
+	if not employee:
+		return None, empty_tree, {user}
+	org_tree = get_org_subtree(employee)
+	return employee, org_tree, {user, *org_tree[0].values()}
 
-		reports_to_by_employee[employee_name] = reports_to
-		employee_display_by_name[employee_name] = employee_display
-		if employee_user:
-			employee_to_user[employee_name] = employee_user
-		if reports_to:
-			children_by_manager[reports_to].append(employee_name)
 
-	return employee_to_user, employee_display_by_name, reports_to_by_employee, children_by_manager
+def _fetch_employees_active():
+	return get_org_tree()
 
 
 def build_average_rows(rows, cycle_dates=None, user_cycle_stats=None):
@@ -228,7 +239,7 @@ def build_average_rows(rows, cycle_dates=None, user_cycle_stats=None):
 	return avg_rows
 
 
-def get_hierarchical_scores(base_rows, cycle_dates=None, user_cycle_stats=None):
+def get_hierarchical_scores(base_rows, cycle_dates=None, user_cycle_stats=None, org_tree=None):
 	cycle_dates = cycle_dates or []
 	user_cycle_stats = user_cycle_stats or {}
 
@@ -241,27 +252,37 @@ def get_hierarchical_scores(base_rows, cycle_dates=None, user_cycle_stats=None):
 		stats_by_user[assignee]["work_item_count"] = row.get("work_item_count") or 0
 
 	employee_to_user, employee_display_by_name, reports_to_by_employee, children_by_manager, stats_by_user = (
-		get_employee_list(stats_by_user)
+		get_employee_list(stats_by_user, org_tree)
 	)
 
+	return build_team_rows(
+		employee_to_user,
+		employee_display_by_name,
+		reports_to_by_employee,
+		children_by_manager,
+		stats_by_user,
+		cycle_dates,
+		user_cycle_stats,
+	) or build_average_rows(base_rows, cycle_dates, user_cycle_stats)
+
+
+def build_team_rows(
+	employee_to_user,
+	employee_display_by_name,
+	reports_to_by_employee,
+	children_by_manager,
+	stats_by_user,
+	cycle_dates=None,
+	user_cycle_stats=None,
+):
+	# Both walks keep their own stacks so that deep org charts do not hit the recursion limit
+	cycle_dates = cycle_dates or []
+	user_cycle_stats = user_cycle_stats or {}
 	memo = {}
-	active_stack = set()
-
-	def aggregate_employee(employee_name):
-		if employee_name in memo:
-			return memo[employee_name]
-		if employee_name in active_stack:
-			# cycle totals: zeros
-			cycle_totals_zero = {cycle: {"total": 0.0, "count": 0} for cycle in cycle_dates}
-			return 0, 0, cycle_totals_zero
-
-		active_stack.add(employee_name)
 
+	def own_totals(employee_name):
 		employee_user = employee_to_user.get(employee_name)
 		own_stats = stats_by_user.get(employee_user, {"total_score": 0, "work_item_count": 0})
-		total_score = own_stats["total_score"]
-		work_item_count = own_stats["work_item_count"]
-
 		# per-cycle totals for this node (employee)
 		cycle_totals = {cycle: {"total": 0.0, "count": 0} for cycle in cycle_dates}
 		if employee_user:
@@ -270,38 +291,75 @@ def get_hierarchical_scores(base_rows, cycle_dates=None, user_cycle_stats=None):
 				if st:
 					cycle_totals[cycle]["total"] += st.get("total", 0.0)
 					cycle_totals[cycle]["count"] += st.get("count", 0)
+		return [own_stats["total_score"], own_stats["work_item_count"], cycle_totals]
 
-		for child_employee in children_by_manager.get(employee_name, []):
-			child_total_score, child_work_item_count, child_cycle_totals = aggregate_employee(child_employee)
-			total_score += child_total_score
-			work_item_count += child_work_item_count
-			for cycle in cycle_dates:
-				ctot = child_cycle_totals.get(cycle, {"total": 0.0, "count": 0})
-				cycle_totals[cycle]["total"] += ctot.get("total", 0.0)
-				cycle_totals[cycle]["count"] += ctot.get("count", 0)
+	def add_totals(totals, child_totals):
+		child_total_score, child_work_item_count, child_cycle_totals = child_totals
+		totals[0] += child_total_score
+		totals[1] += child_work_item_count
+		for cycle in cycle_dates:
+			ctot = child_cycle_totals.get(cycle, {"total": 0.0, "count": 0})
+			totals[2][cycle]["total"] += ctot.get("total", 0.0)
+			totals[2][cycle]["count"] += ctot.get("count", 0)
+
+	def aggregate_employee(employee_name):
+		# Post-order over children_by_manager. A child already on the path closes a cycle and
+		# counts as zero, so the totals of a cyclic team depend on where the walk entered it.
+		if employee_name in memo:
+			return memo[employee_name]
+
+		active_stack = {employee_name}
+		stack = [(employee_name, iter(children_by_manager.get(employee_name, [])), own_totals(employee_name))]
+		while stack:
+			current, children, totals = stack[-1]
+			for child_employee in children:
+				if child_employee in memo:
+					add_totals(totals, memo[child_employee])
+				elif child_employee not in active_stack:
+					active_stack.add(child_employee)
+					stack.append(
+						(
+							child_employee,
+							iter(children_by_manager.get(child_employee, [])),
+							own_totals(child_employee),
+						)
+					)
+					break
+			else:
+				stack.pop()
+				active_stack.remove(current)
+				memo[current] = tuple(totals)
+				if stack:
+					add_totals(stack[-1][2], memo[current])
 
-		active_stack.remove(employee_name)
-		memo[employee_name] = (total_score, work_item_count, cycle_totals)
 		return memo[employee_name]
 
 	def to_score(total_score, work_item_count):
 		return round(total_score / work_item_count, 0) if work_item_count else 0
 
-	def make_row(user, user_id, total_score, work_item_count, indent, is_group, cycle_values=None):
+	# Same query strings as urlencode, with each cycle quoted once instead of once per row
+	quoted_cycles = {cycle: urllib.parse.quote_plus(str(cycle)) for cycle in cycle_dates}
+
+	def make_row(
+		user, user_id, total_score, work_item_count, indent, is_group, cycle_values=None, employee=None
+	):
 		row = {
 			"user": user,
 			"user_id": user_id,
+			"employee": employee,
 			"score": to_score(total_score, work_item_count),
 			"indent": indent,
 			"is_group": is_group,
 		}
 		cycle_values = cycle_values or {}
+		quoted_user = None
 		for cycle in cycle_dates:
 			c = cycle_values.get(cycle, {"total": 0.0, "count": 0})
 			score_val = to_score(c.get("total", 0.0), c.get("count", 0))
 			if user_id and not is_group and c.get("count", 0):
-				url_params = urllib.parse.urlencode(
-					{"assignee": user_id, "report_cycle": cycle, "action": "Scheduled Job"}
+				quoted_user = quoted_user or urllib.parse.quote_plus(str(user_id))
+				url_params = (
+					f"assignee={quoted_user}&report_cycle={quoted_cycles[cycle]}&action=Scheduled+Job"
 				)
 				row[f"score_{cycle}"] = (
 					f"<a href='/app/work-item-score-summary?{url_params}' target='_blank'>{score_val}</a>"
@@ -323,60 +381,68 @@ def get_hierarchical_scores(base_rows, cycle_dates=None, user_cycle_stats=None):
 	rows = []
 	visited = set()
 
-	def add_employee_rows(employee_name, indent=0):
-		if employee_name in visited:
-			return
-		visited.add(employee_name)
-		employee_user = employee_to_user.get(employee_name)
-		own_stats = get_user_stats(employee_user)
-		team_total_score, team_work_item_count, team_cycle_totals = aggregate_employee(employee_name)
-		children = children_by_manager.get(employee_name, [])
-		has_children = bool(children)
-
-		if has_children:
-			rows.append(
-				make_row(
-					user=f"{employee_display_by_name.get(employee_name)} (Team)",
-					user_id=employee_user,
-					total_score=team_total_score,
-					work_item_count=team_work_item_count,
-					indent=indent,
-					is_group=1,
-					cycle_values=team_cycle_totals,
+	def add_employee_rows(root_employee):
+		# Pre-order with children sorted, visited is checked when a node is popped so that a node
+		# reachable twice is shown under the first team that reaches it
+		stack = [(root_employee, 0)]
+		while stack:
+			employee_name, indent = stack.pop()
+			if employee_name in visited:
+				continue
+			visited.add(employee_name)
+			employee_user = employee_to_user.get(employee_name)
+			own_stats = get_user_stats(employee_user)
+			team_total_score, team_work_item_count, team_cycle_totals = aggregate_employee(employee_name)
+			children = children_by_manager.get(employee_name, [])
+			has_children = bool(children)
+
+			if has_children:
+				rows.append(
+					make_row(
+						user=f"{employee_display_by_name.get(employee_name)} (Team)",
+						user_id=employee_user,
+						total_score=team_total_score,
+						work_item_count=team_work_item_count,
+						indent=indent,
+						is_group=1,
+						cycle_values=team_cycle_totals,
+						employee=employee_name,
+					)
 				)
-			)
+
+				if employee_user:
+					rows.append(
+						make_row(
+							user=employee_display_by_name.get(employee_name) or employee_user,
+							user_id=employee_user,
+							total_score=own_stats["total_score"],
+							work_item_count=own_stats["work_item_count"],
+							indent=indent + 1,
+							is_group=0,
+							cycle_values=user_cycle_stats.get(employee_user, {}),
+						)
+					)
+
+				stack.extend(
+					(child_employee, indent + 1)
+					for child_employee in reversed(sorted(children, key=sort_key))
+				)
+				continue
 
 			if employee_user:
+				# leaf employee row
 				rows.append(
 					make_row(
 						user=employee_display_by_name.get(employee_name) or employee_user,
 						user_id=employee_user,
 						total_score=own_stats["total_score"],
 						work_item_count=own_stats["work_item_count"],
-						indent=indent + 1,
+						indent=indent,
 						is_group=0,
 						cycle_values=user_cycle_stats.get(employee_user, {}),
 					)
 				)
 
-			for child_employee in sorted(children, key=sort_key):
-				add_employee_rows(child_employee, indent + 1)
-			return
-
-		if employee_user:
-			# leaf employee row
-			rows.append(
-				make_row(
-					user=employee_display_by_name.get(employee_name) or employee_user,
-					user_id=employee_user,
-					total_score=own_stats["total_score"],
-					work_item_count=own_stats["work_item_count"],
-					indent=indent,
-					is_group=0,
-					cycle_values=user_cycle_stats.get(employee_user, {}),
-				)
-			)
-
 	all_employee_names = set(reports_to_by_employee)
 	root_employees = sorted(
 		[
@@ -391,12 +457,12 @@ def get_hierarchical_scores(base_rows, cycle_dates=None, user_cycle_stats=None):
 		root_employees = sorted(all_employee_names, key=sort_key)
 
 	for root_employee in root_employees:
-		add_employee_rows(root_employee, indent=0)
+		add_employee_rows(root_employee)
 
 	# If any employee was not reachable from roots (broken/cyclic hierarchy), still show them.
 	for employee_name in sorted(all_employee_names, key=sort_key):
 		if employee_name not in visited:
-			add_employee_rows(employee_name, indent=0)
+			add_employee_rows(employee_name)
 
 	# Handle users with scores who are not mapped to Employee
 	employee_users = set(employee_to_user.values())
@@ -415,17 +481,14 @@ def get_hierarchical_scores(base_rows, cycle_dates=None, user_cycle_stats=None):
 			)
 		)
 
-	if not rows:
-		return build_average_rows(base_rows, cycle_dates, user_cycle_stats)
-
 	return rows
 
 
-def get_employee_list(stats_by_user=None):
+def get_employee_list(stats_by_user=None, org_tree=None):
 	employee_to_user, employee_display_by_name, reports_to_by_employee, children_by_manager = (
-		_fetch_employees_active()
+		org_tree or _fetch_employees_active()
 	)
-	if stats_by_user:
+	if stats_by_user is not None:
 		for uid in employee_to_user.values():
 			stats_by_user.setdefault(uid, {"total_score": 0, "work_item_count": 0})
 		return (
@@ -0,0 +1,44 @@
+# Copyright (c) 2026, Chethan - Aerele and contributors
+# For license information, please see license.txt
+
+import hashlib
+import json
+
+import frappe
+
+SCORE_BOARD_VERSION_CACHE_KEY = "taskstream:score_board_version"
+SCORE_BOARD_CACHE_KEY = "taskstream:score_board"
+# Work Items going past their target date change the board without any write, the TTL bounds that
+SCORE_BOARD_CACHE_TTL = 15 * 60
+# Work Item fields the Score Board reads: those that move an item into, out of or between rows, and
+# the score behind "Current Score". Only real changes invalidate, a save that recomputes the same
+# score does not. The scheduled scoring writes without saving and invalidates through its summaries.
+SCORE_BOARD_FIELDS = ("status", "assignee", "actual_end_date", "target_end_date", "score")
+
+
+def get_cached_score_board(key_parts, compute):
+	# Board computed by `compute()`, shared while the score data version and key_parts match
+	key = get_score_board_key(key_parts)
+	rows = frappe.cache.get_value(key)
+	if rows is None:
+		rows = compute()
+		frappe.cache.set_value(key, rows, expires_in_sec=SCORE_BOARD_CACHE_TTL)
+	return rows
+
+
+def get_score_board_key(key_parts):
+	# The version is part of the key, so a bump retires every cached board at once
+	version = frappe.cache.get_value(SCORE_BOARD_VERSION_CACHE_KEY) or _bump_score_board_version()
+	digest = hashlib.sha1(json.dumps([version, *key_parts], default=str).encode()).hexdigest()
+	return f"{SCORE_BOARD_CACHE_KEY}:{digest}"
+
+
+def invalidate_score_board(doc=None, method=None):
+	# After commit, a board computed before then would otherwise be cached under the new version
+	frappe.db.after_commit.add(_bump_score_board_version)
+
+
+def _bump_score_board_version():
+	version = frappe.generate_hash(length=10)
+	frappe.cache.set_value(SCORE_BOARD_VERSION_CACHE_KEY, version)
+	return version
@@ -0,0 +1,128 @@
+# Copyright (c) 2026, Chethan - Aerele and contributors
+# For license information, please see license.txt
+
+import hashlib
+import json
+
+import frappe
+from frappe.utils import flt, get_datetime, now_datetime
+
+SCORING_FIELDS = (
+	"name",
+	"assignee",
+	"target_end_date",
+	"actual_end_date",
+	"benefit_of_work_done",
+	"revision_count",
+	"rework_count",
+)
+
+SCORE_CONFIG_FIELDS = (
+	"penalty_per_minute",
+	"penalty_points_per_day",
+	"max_delay_penalty",
+	"completion_score",
+	"revision_impact",
+	"max_allowed_revision",
+	"rework_impact",
+	"max_allowed_rework",
+	"max_rework_penalty",
+)
+
+# Work Item Score Config names are content hashes, so a name once seen never changes meaning.
+# Kept per site, and a name is only added once a commit has kept its row.
+_known_score_configs = {}
+
+
+def compute_score(
+	config, target_end_date, actual_end_date, benefit_of_work_done, revision_count, rework_count, now=None
+):
+	planned_end_time = get_datetime(target_end_date) if target_end_date else None
+	actual_end_time = get_datetime(actual_end_date) if actual_end_date else (now or now_datetime())
+
+	if not planned_end_time:
+		return None
+
+	total_delay_minutes = (actual_end_time - planned_end_time).total_seconds() / 60
+	if actual_end_time <= planned_end_time:
+		delay_penalty = 0
+	elif total_delay_minutes < 1440:
+		delay_penalty = total_delay_minutes * config.penalty_per_minute
+	else:
+		delay_penalty = ((total_delay_minutes // 1440) * config.penalty_points_per_day) + (
+			(total_delay_minutes % 1440) * config.penalty_per_minute
+		)
+	delay_penalty = min(delay_penalty, config.max_delay_penalty)
+
+	benefit_penalty = get_benefit_penalty(benefit_of_work_done, config.completion_score)
+	revision_penalty = ((revision_count or 0) / config.max_allowed_revision) * config.revision_impact
+	rework_penalty = ((rework_count or 0) / config.max_allowed_rework) * config.rework_impact
+	rework_penalty = min(rework_penalty, config.max_rework_penalty)
+	total_score = 0 - benefit_penalty - delay_penalty - revision_penalty - rework_penalty
+
+	return frappe._dict(
+		score=max(total_score, -100),
+		delay_minutes=total_delay_minutes,
+		delay_penalty=delay_penalty,
+		benefit_penalty=benefit_penalty,
+		revision_penalty=revision_penalty,
+		rework_penalty=rework_penalty,
+	)
+
+
+def compute_scores(rows, config, now=None):
+	# Scores a chunk of rows holding SCORING_FIELDS, rows without a target end date are skipped
+	now = now or now_datetime()
+	scores = {}
+	for row in rows:
+		breakdown = compute_score(
+			config,
+			row.target_end_date,
+			row.actual_end_date,
+			row.benefit_of_work_done,
+			row.revision_count,
+			row.rework_count,
+			now=now,
+		)
+		if breakdown:
+			scores[row.name] = breakdown
+	return scores
+
+
+def get_benefit_penalty(benefit_of_work_done, completion_score):
+	benefit_of_work_done = 100 - float(benefit_of_work_done or 0)
+	return (benefit_of_work_done / 100) * completion_score
+
+
+def get_score_config(config):
+	# Snapshot of the scoring parameters in force, referenced by scored rows instead of a rendered summary
+	values = {fieldname: flt(getattr(config, fieldname)) for fieldname in SCORE_CONFIG_FIELDS}
+	name = hashlib.sha1(json.dumps(values, sort_keys=True).encode()).hexdigest()[:10]
+	site = frappe.local.site
+	if name in _known_score_configs.get(site, ()):
+		return name
+
+	if not frappe.db.exists("Work Item Score Config", name):
+		frappe.get_doc({"doctype": "Work Item Score Config", "name": name, **values}).db_insert(
+			ignore_if_duplicate=True
+		)
+
+	def _remember():
+		# A rollback to a savepoint drops the row but not this callback, so check it was kept
+		if frappe.db.exists("Work Item Score Config", name):
+			_known_score_configs.setdefault(site, set()).add(name)
+
+	frappe.db.after_commit.add(_remember)
+	return name
+
+
+def get_breakdown_fields(breakdown, score_config):
+	return {
+		"score": breakdown.score,
+		"delay_minutes": breakdown.delay_minutes,
+		"delay_penalty": breakdown.delay_penalty,
+		"rework_penalty": breakdown.rework_penalty,
+		"revision_penalty": breakdown.revision_penalty,
+		"benefit_penalty": breakdown.benefit_penalty,
+		"score_config": score_config,
+	}
@@ -0,0 +1,101 @@
+# Copyright (c) 2026, Chethan - Aerele and contributors
+# For license information, please see license.txt
+
+from datetime import datetime, time
+
+import frappe
+from frappe.utils import add_days, get_datetime, getdate, now_datetime
+
+from taskstream.taskstream.config import get_config
+from taskstream.taskstream.doctype.work_item.work_item import (
+	bulk_create_work_item_recurrences,
+	set_materialized_until,
+)
+from taskstream.taskstream.doctype.work_item_slot.work_item_slot import get_slots
+
+BATCH_SIZE = 100
+
+
+def materialize_recurrences():
+	# Keeps `recurrence_creation_limit` days of future instances for every active master.
+	# Each master resumes from its `materialized_until` cursor in its Work Item Slot schedule,
+	# so re-running is a no-op.
+	creation_limit = get_config().recurrence_creation_limit
+	today = getdate(now_datetime())
+	horizon = datetime.combine(add_days(today, int(creation_limit)), datetime.max.time())
+
+	last_name = ""
+	while True:
+		masters = get_active_masters(today, last_name)
+		if not masters:
+			break
+
+		for master in masters:
+			try:
+				materialize_master(master, horizon)
+			except Exception as e:
+				frappe.db.rollback()
+				frappe.log_error(
+					message=f"Error materializing Work Item {master}: {e!s}",
+					title="Recurrence Materializer",
+				)
+			else:
+				frappe.db.commit()
+
+		last_name = masters[-1]
+
+
+def get_active_masters(today, last_name="", limit=BATCH_SIZE):
+	return frappe.get_all(
+		"Work Item",
+		filters={
+			"work_item_type": "Recurrence Master",
+			"repeat_until": (">=", today),
+			"name": (">", last_name),
+		},
+		pluck="name",
+		order_by="name asc",
+		limit=limit,
+	)
+
+
+def materialize_master(master_name, horizon):
+	# Same lock as the completion path, so a completion can't create a slot's instance
+	# between the `existing` check and the insert below
+	frappe.db.sql("SELECT name FROM `tabWork Item` WHERE name = %s FOR UPDATE", (master_name,))
+	master = frappe.get_doc("Work Item", master_name)
+	now = now_datetime()
+	cursor = max(get_datetime(master.materialized_until), now) if master.materialized_until else now
+
+	slots = [
+		(
+			slot_datetime,
+			slot_datetime.date(),
+			slot_datetime - datetime.combine(slot_datetime.date(), time.min),
+		)
+		for slot_datetime in map(get_datetime, get_slots(master_name, cursor, horizon))
+	]
+	if not slots:
+		return
+
+	existing = {
+		get_datetime(target_end_date)
+		for target_end_date in frappe.get_all(
+			"Work Item",
+			filters={
+				"reference_doctype": "Work Item",
+				"reference_document": master_name,
+				"target_end_date": ("between", [slots[0][0], slots[-1][0]]),
+			},
+			pluck="target_end_date",
+		)
+	}
+	bulk_create_work_item_recurrences(
+		master,
+		[
+			(slot_date, slot_time)
+			for slot_datetime, slot_date, slot_time in slots
+			if slot_datetime not in existing
+		],
+	)
+	set_materialized_until(master_name, slots[-1][0])
@@ -0,0 +1,87 @@
+from datetime import timedelta
+
+import frappe
+from frappe.desk.doctype.notification_log.notification_log import enqueue_create_notification
+from frappe.utils import now_datetime
+
+from taskstream.taskstream.config import get_config
+
+
+def flush_notification_outbox():
+	config = get_config()
+	cutoff = now_datetime() - timedelta(minutes=config.notification_digest_window)
+	for recipient in get_due_recipients(cutoff):
+		try:
+			send_digest(recipient, config)
+			frappe.db.commit()
+		except Exception as e:
+			frappe.db.rollback()
+			frappe.log_error(
+				message=f"Error sending notification digest to {recipient}: {e!s}",
+				title="Notification Outbox",
+			)
+
+
+def get_due_recipients(cutoff):
+	# A recipient is flushed once their oldest pending event has waited out the window,
+	# read off the (recipient, creation) index
+	return frappe.db.sql(
+		"""
+		SELECT recipient
+		FROM `tabWork Item Notification Outbox`
+		GROUP BY recipient
+		HAVING MIN(creation) <= %s
+		""",
+		(cutoff,),
+		pluck=True,
+	)
+
+
+def send_digest(recipient, config):
+	events = frappe.db.sql(
+		"""
+		SELECT name, work_item, subject, document_type, document_name, from_user, content
+		FROM `tabWork Item Notification Outbox`
+		WHERE recipient = %s
+		ORDER BY creation
+		FOR UPDATE SKIP LOCKED
+		""",
+		(recipient,),
+		as_dict=True,
+	)
+	if not events:
+		return
+	frappe.db.delete("Work Item Notification Outbox", {"name": ("in", [event.name for event in events])})
+
+	# Repeated events for the same document collapse into one entry per distinct message
+	groups = {}
+	for event in events:
+		group = groups.setdefault(
+			(event.document_type, event.document_name), frappe._dict(event, contents=[])
+		)
+		if event.content not in group.contents:
+			group.contents.append(event.content)
+
+	groups = list(groups.values())
+	if config.email_alert:
+		if len(groups) == 1:
+			subject = groups[0].subject
+		else:
+			subject = f"{len(groups)} Work Item notifications"
+		message = "<hr>".join("<br>".join(group.contents) for group in groups)
+		frappe.sendmail(recipients=[recipient], subject=subject, message=message)
+
+	# One email, but a notification per document so each links to what it is about
+	if config.system_notification:
+		for group in groups:
+			enqueue_create_notification(
+				recipient,
+				{
+					"type": "Share",
+					"document_type": group.document_type,
+					"document_name": group.document_name,
+					"subject": group.subject,
+					"email_content": "<br>".join(group.contents),
+					"from_user": group.from_user,
+				},
+			)
@@ -2,49 +2,237 @@ from datetime import timedelta
 
 import frappe
 from frappe.utils import add_days, get_datetime, now_datetime
+from frappe.utils.background_jobs import is_job_enqueued
 
-from taskstream.taskstream.doctype.work_item.work_item import calculate_score
+from taskstream.api import get_reporting_window
+from taskstream.taskstream.config import get_config, set_last_executed_on
+from taskstream.taskstream.doctype.work_item_score_summary.work_item_score_summary import (
+	ScoreSummaryWriter,
+)
+from taskstream.taskstream.scoring import (
+	SCORING_FIELDS,
+	compute_scores,
+	get_breakdown_fields,
+	get_score_config,
+)
+
+CHUNK_SIZE = 1000
+SHARD_SIZE = 20000
+SHARD_TIMEOUT = 3600
+ROW_SAVEPOINT = "taskstream_score_row"
 
 
 def get_report_data():
-	last_executed_on, reporting_frequency = frappe.db.get_value(
-		"Work Item Configuration", "Work Item Configuration", ["last_executed_on", "reporting_frequency"]
-	)
+	config = get_config()
 
-	if last_executed_on:
-		last_executed_on = get_datetime(last_executed_on).date()
-		frequency = int(reporting_frequency or 0)
-		next_execution_time = last_executed_on + timedelta(days=frequency)
+	if config.last_executed_on:
+		next_execution_time = config.last_executed_on + timedelta(days=config.reporting_frequency)
 		if next_execution_time > now_datetime().date():
 			return
 
 	else:
+		set_last_executed_on(now_datetime().date())
+
+	if frappe.db.exists("Work Item Score Run", {"status": "Running"}):
+		resume_score_runs()
+		return
+
+	start_score_run()
+
+
+def start_score_run():
+	run = frappe.new_doc("Work Item Score Run")
+	run.started_on = now_datetime()
+	run.report_cycle = get_reporting_window()
+	from_name = ""
+	for to_name in _get_shard_boundaries():
+		run.append("shards", {"from_name": from_name, "to_name": to_name})
+		from_name = to_name
+	run.append("shards", {"from_name": from_name})
+	run.total_shards = len(run.shards)
+	run.insert(ignore_permissions=True)
+
+	for shard in run.shards:
+		_enqueue_shard(run.name, shard.name)
+	frappe.db.commit()
+	return run
+
+
+def resume_score_runs():
+	# Re-enqueues shards whose worker died or timed out, they continue from their checkpoint
+	for run in frappe.get_all("Work Item Score Run", filters={"status": "Running"}, pluck="name"):
+		shards = frappe.get_all(
+			"Work Item Score Run Shard",
+			filters={"parent": run, "parenttype": "Work Item Score Run", "status": ["!=", "Completed"]},
+			fields=["name", "job_id"],
+		)
+		for shard in shards:
+			if not shard.job_id or not is_job_enqueued(shard.job_id):
+				_enqueue_shard(run, shard.name)
+		frappe.db.commit()
+		if not shards:
+			_complete_run(run)
+
+
+def process_score_shard(run, shard):
+	shard_doc = frappe.db.get_value(
+		"Work Item Score Run Shard",
+		shard,
+		["from_name", "to_name", "status", "last_processed", "processed_items"],
+		as_dict=True,
+	)
+	if not shard_doc or shard_doc.status == "Completed":
+		return
+
+	frappe.db.set_value("Work Item Score Run Shard", shard, "status", "Running", update_modified=False)
+	frappe.db.commit()
+
+	config = get_config()
+	writer = ScoreSummaryWriter(
+		report_cycle=frappe.db.get_value("Work Item Score Run", run, "report_cycle"), batch_size=CHUNK_SIZE
+	)
+	last_name = shard_doc.last_processed or shard_doc.from_name or ""
+	processed_items = shard_doc.processed_items or 0
+	while True:
+		filters = [["status", "!=", "Done"], ["name", ">", last_name]]
+		if shard_doc.to_name:
+			filters.append(["name", "<=", shard_doc.to_name])
+		rows = frappe.get_all(
+			"Work Item",
+			filters=filters,
+			fields=list(SCORING_FIELDS),
+			order_by="name asc",
+			limit=CHUNK_SIZE,
+		)
+		if not rows:
+			break
+
+		try:
+			score_work_items(rows, config, writer)
+		except Exception:
+			# Go again one row at a time so only the failing Work Items miss this cycle
+			frappe.db.rollback()
+			writer.discard()
+			score_work_items_individually(rows, config, writer)
+		last_name = rows[-1].name
+		processed_items += len(rows)
 		frappe.db.set_value(
-			"Work Item Configuration",
-			"Work Item Configuration",
-			"last_executed_on",
-			now_datetime().date(),
+			"Work Item Score Run Shard",
+			shard,
+			{"last_processed": last_name, "processed_items": processed_items},
+			update_modified=False,
+		)
+		frappe.db.commit()
+
+	frappe.db.set_value("Work Item Score Run Shard", shard, "status", "Completed", update_modified=False)
+	frappe.db.sql(
+		"""
+		UPDATE `tabWork Item Score Run`
+		SET completed_shards = completed_shards + 1, processed_items = processed_items + %s
+		WHERE name = %s
+		""",
+		(processed_items, run),
+	)
+	frappe.db.commit()
+	_complete_run(run)
+
+
+def _complete_run(run):
+	# The row lock makes sure only the last shard to finish closes the run
+	run_doc = frappe.db.sql(
+		"""
+		SELECT status, started_on, total_shards, completed_shards, processed_items
+		FROM `tabWork Item Score Run`
+		WHERE name = %s
+		FOR UPDATE
+		""",
+		(run,),
+		as_dict=True,
+	)
+	if not run_doc or run_doc[0].status != "Running" or run_doc[0].completed_shards < run_doc[0].total_shards:
+		frappe.db.commit()
+		return
+
+	run_doc = run_doc[0]
+	completed_on = now_datetime()
+	elapsed = (completed_on - get_datetime(run_doc.started_on)).total_seconds()
+	frappe.db.set_value(
+		"Work Item Score Run",
+		run,
+		{
+			"status": "Completed",
+			"completed_on": completed_on,
+			"throughput": run_doc.processed_items / elapsed if elapsed > 0 else run_doc.processed_items,
+		},
+	)
+	set_last_executed_on(now_datetime().date())
+	frappe.db.commit()
+
+
+def _get_shard_boundaries():
+	boundaries = []
+	last_name = ""
+	while True:
+		boundary = frappe.db.sql(
+			"""
+			SELECT name
+			FROM `tabWork Item`
+			WHERE status != 'Done' AND name > %s
+			ORDER BY name
+			LIMIT 1 OFFSET %s
+			""",
+			(last_name, SHARD_SIZE - 1),
 		)
+		if not boundary:
+			return boundaries
+		last_name = boundary[0][0]
+		boundaries.append(last_name)
 
-	work_items = frappe.get_list(
-		"Work Item",
-		filters={"status": ["!=", "Done"]},
+
+def _enqueue_shard(run, shard):
+	job_id = f"taskstream-score-run::{run}::{shard}"
+	frappe.db.set_value("Work Item Score Run Shard", shard, "job_id", job_id, update_modified=False)
+	frappe.enqueue(
+		process_score_shard,
+		queue="long",
+		timeout=SHARD_TIMEOUT,
+		job_id=job_id,
+		deduplicate=True,
+		enqueue_after_commit=True,
+		run=run,
+		shard=shard,
 	)
 
-	for work_item in work_items:
+
+def score_work_items_individually(rows, config, writer):
+	for row in rows:
+		frappe.db.savepoint(ROW_SAVEPOINT)
 		try:
-			wi = frappe.get_doc("Work Item", work_item.name)
-			calculate_score(wi, "Scheduled Job")
-			wi.save()
+			score_work_items([row], config, writer)
 		except Exception as e:
+			frappe.db.rollback(save_point=ROW_SAVEPOINT)
+			writer.discard()
 			frappe.log_error(
-				message=f"Error processing Work Item {work_item.name}: {e!s}",
+				message=f"Error processing Work Item {row.name}: {e!s}",
 				title="Report Data Scheduler",
 			)
+		else:
+			frappe.db.release_savepoint(ROW_SAVEPOINT)
 
-	frappe.db.set_value(
-		"Work Item Configuration",
-		"Work Item Configuration",
-		"last_executed_on",
-		now_datetime().date(),
-	)
+
+def score_work_items(rows, config, writer):
+	# Set-based equivalent of calculate_score(doc, "Scheduled Job") + save() for a chunk of rows
+	scores = compute_scores(rows, config)
+	score_config = get_score_config(config)
+	updates = {}
+	for row in rows:
+		breakdown = scores.get(row.name)
+		if not breakdown:
+			continue
+		updates[row.name] = get_breakdown_fields(breakdown, score_config)
+		row.update(updates[row.name])
+		writer.add(row, "Scheduled Job")
+
+	if updates:
+		frappe.db.bulk_update("Work Item", updates, update_modified=False)
+	writer.flush()
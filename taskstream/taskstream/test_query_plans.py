@@ -0,0 +1,268 @@
+# Copyright (c) 2026, Chethan - Aerele and Contributors
+# See license.txt
+
+from contextlib import contextmanager
+from datetime import timedelta
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import now_datetime
+
+from taskstream.scheduler_events import get_dedup_key, trigger_work_item_exists
+from taskstream.taskstream.assignment import clear_open_counts, get_open_counts
+from taskstream.taskstream.doctype.work_item.work_item import _get_work_item
+from taskstream.taskstream.doctype.work_item.work_item import on_doctype_update as work_item_indexes
+from taskstream.taskstream.doctype.work_item_notification_outbox.work_item_notification_outbox import (
+	on_doctype_update as work_item_notification_outbox_indexes,
+)
+from taskstream.taskstream.doctype.work_item_participant.work_item_participant import set_participants
+from taskstream.taskstream.doctype.work_item_score_aggregate.work_item_score_aggregate import (
+	get_key_name,
+	get_user_cycle_stats,
+)
+from taskstream.taskstream.doctype.work_item_score_aggregate.work_item_score_aggregate import (
+	on_doctype_update as work_item_score_aggregate_indexes,
+)
+from taskstream.taskstream.doctype.work_item_score_summary.work_item_score_summary import (
+	on_doctype_update as work_item_score_summary_indexes,
+)
+from taskstream.taskstream.permission import work_item_user_condition
+from taskstream.taskstream.reminders import rebuild_reminder_timers
+from taskstream.taskstream.report.work_item_report.work_item_report import (
+	_get_cycle_scores,
+	get_work_item_page,
+)
+from taskstream.taskstream.report.work_item_score_board.work_item_score_board import get_user_score_query
+from taskstream.taskstream.tasks.materialize import get_active_masters
+from taskstream.taskstream.tasks.notifications import get_due_recipients
+
+PREFIX = "WI-QP-"
+WORK_ITEMS = 3000
+USERS = [f"qp-user-{i}@example.com" for i in range(50)]
+CYCLES = [f"Cycle {i:02d}" for i in range(40)]
+
+
+@contextmanager
+def capture_selects():
+	# The SELECTs a code path sends, with their values, so their plans can be checked as they run
+	selects = []
+	sql = frappe.db.sql
+
+	def _sql(query, *args, **kwargs):
+		if str(query).lstrip().upper().startswith("SELECT"):
+			selects.append((str(query), kwargs.get("values", args[0] if args else ())))
+		return sql(query, *args, **kwargs)
+
+	with patch.object(frappe.db, "sql", _sql):
+		yield selects
+
+
+class TestQueryPlans(FrappeTestCase):
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		work_item_indexes()
+		work_item_score_summary_indexes()
+		work_item_score_aggregate_indexes()
+		work_item_notification_outbox_indexes()
+		cls.now = now_datetime()
+		cls.window = (cls.now - timedelta(days=7), cls.now)
+		cls.seed()
+
+	@classmethod
+	def tearDownClass(cls):
+		frappe.db.delete("Work Item Participant", {"work_item": ("like", f"{PREFIX}%")})
+		frappe.db.delete("Work Item Score Summary", {"work_item": ("like", f"{PREFIX}%")})
+		frappe.db.delete("Work Item Score Aggregate", {"assignee": ("in", USERS)})
+		frappe.db.delete("Work Item Notification Outbox", {"recipient": ("in", USERS)})
+		frappe.db.delete("Work Item", {"name": ("like", f"{PREFIX}%")})
+		frappe.db.commit()
+		super().tearDownClass()
+
+	@classmethod
+	def seed(cls):
+		# Mostly closed history with a thin layer of open work, like a long running site
+		now = cls.now
+		work_items = []
+		for i in range(WORK_ITEMS):
+			done = i % 10 != 0
+			target = now - timedelta(hours=6 * i)
+			work_items.append(
+				frappe._dict(
+					name=f"{PREFIX}{i:05d}",
+					creation=now,
+					modified=now,
+					owner="Administrator",
+					modified_by="Administrator",
+					summary="Sales Order Created" if i % 100 == 0 else f"Query plan {i}",
+					status="Done" if done else "Open",
+					assignee=USERS[i % len(USERS)],
+					requester=USERS[(i + 1) % len(USERS)],
+					reporter=None,
+					reviewer=None,
+					work_item_type="Recurrence Master" if i % 100 == 1 else "Recurring Instance",
+					repeat_until=(now + timedelta(days=30)).date() if i % 100 == 1 else None,
+					reference_doctype="Sales Order" if i % 100 == 0 else "Work Item",
+					reference_document=f"{PREFIX}REF-{i % 200}",
+					dedup_key=get_dedup_key("Sales Order", f"{PREFIX}REF-{i % 200}", "Sales Order Created")
+					if i % 100 == 0 and i < 200
+					else None,
+					target_end_date=target,
+					actual_end_date=target + timedelta(hours=1) if done else None,
+					twenty_percent_reminder_time=target - timedelta(hours=1),
+					twenty_percent_reminder_sent=1 if done else 0,
+					deadline_reminder_sent=1 if done else 0,
+				)
+			)
+		fields = list(work_items[0])
+		frappe.db.bulk_insert("Work Item", fields, [tuple(wi.values()) for wi in work_items])
+		set_participants(work_items)
+
+		summaries = [
+			(
+				f"{PREFIX}S{i:06d}",
+				now,
+				now,
+				"Administrator",
+				"Administrator",
+				f"{PREFIX}{i % WORK_ITEMS:05d}",
+				USERS[i % len(USERS)],
+				-1.0,
+				"Scheduled Job" if i % 4 else "Work Item Update",
+				CYCLES[i % len(CYCLES)],
+			)
+			for i in range(WORK_ITEMS * 4)
+		]
+		frappe.db.bulk_insert(
+			"Work Item Score Summary",
+			[
+				"name",
+				"creation",
+				"modified",
+				"owner",
+				"modified_by",
+				"work_item",
+				"assignee",
+				"score",
+				"action",
+				"report_cycle",
+			],
+			summaries,
+		)
+		frappe.db.bulk_insert(
+			"Work Item Score Aggregate",
+			[
+				"name",
+				"creation",
+				"modified",
+				"owner",
+				"modified_by",
+				"assignee",
+				"report_cycle",
+				"total_score",
+				"work_item_count",
+			],
+			[
+				(
+					get_key_name(user, cycle),
+					now,
+					now,
+					"Administrator",
+					"Administrator",
+					user,
+					cycle,
+					-10.0,
+					10,
+				)
+				for user in USERS
+				for cycle in CYCLES
+			],
+		)
+		frappe.db.bulk_insert(
+			"Work Item Notification Outbox",
+			["name", "creation", "modified", "owner", "modified_by", "recipient", "work_item", "subject"],
+			[
+				(
+					f"{PREFIX}N{i:05d}",
+					now - timedelta(minutes=i),
+					now,
+					"Administrator",
+					"Administrator",
+					USERS[i % len(USERS)],
+					f"{PREFIX}{i:05d}",
+					f"Query plan {i}",
+				)
+				for i in range(WORK_ITEMS)
+			],
+		)
+		frappe.db.commit()
+		for doctype in (
+			"Work Item",
+			"Work Item Score Summary",
+			"Work Item Score Aggregate",
+			"Work Item Participant",
+			"Work Item Notification Outbox",
+		):
+			frappe.db.sql(f"ANALYZE TABLE `tab{doctype}`")
+
+	def assertNoFullScan(self, query, values=None):
+		plan = frappe.db.sql(f"EXPLAIN {query}", values or (), as_dict=True)
+		# Derived and materialized tables (<subquery2>, <derived3>) are built from an index lookup
+		full_scans = [
+			row
+			for row in plan
+			if (row.get("type") or "").upper() in ("ALL", "INDEX")
+			and not (row.get("table") or "").startswith("<")
+		]
+		self.assertFalse(full_scans, f"Full scan in plan: {plan}\n{query}")
+
+	def assertPathUsesIndexes(self, run):
+		with capture_selects() as selects:
+			run()
+		self.assertTrue(selects, "The code path sent no SELECT")
+		for query, values in selects:
+			self.assertNoFullScan(query, values)
+
+	def test_hot_paths_use_indexes(self):
+		window = self.window
+		last_row = frappe._dict(target_date=self.now - timedelta(days=30), work_item=f"{PREFIX}00120")
+		hot_paths = {
+			# work_item_report.get_data, first and a later page of the window
+			"report_page": lambda: get_work_item_page(frappe._dict(), window),
+			"report_next_page": lambda: get_work_item_page(
+				frappe._dict(), window, after=(last_row.target_date, last_row.work_item)
+			),
+			"report_reference": lambda: get_work_item_page(frappe._dict(reference=f"{PREFIX}REF-7"), window),
+			"report_assignee_done": lambda: get_work_item_page(
+				frappe._dict(assignee=USERS[7], status="Done"), window
+			),
+			# work_item_report._build_rows, cycle scores of a page
+			"report_cycle_scores": lambda: _get_cycle_scores(
+				[f"{PREFIX}{i:05d}" for i in range(10, 60)], CYCLES[:3], 3
+			),
+			# work_item_score_board.get_score_board_rows, a manager's team
+			"score_board_team": lambda: get_user_score_query(*window, self.now, USERS[7:10]).run(),
+			"score_board_cycle_stats": lambda: get_user_cycle_stats(CYCLES[:3], USERS[7:10]),
+			# work_item._get_work_item
+			"instances_of_master": lambda: _get_work_item(f"{PREFIX}REF-7"),
+			# scheduler_events._create_work_item
+			"trigger_exists": lambda: trigger_work_item_exists(
+				get_dedup_key("Sales Order", f"{PREFIX}REF-0", "Sales Order Created")
+			),
+			# tasks.materialize.materialize_recurrences
+			"active_masters": lambda: get_active_masters(self.now.date()),
+			# reminders.rebuild_reminder_timers, every page of both reminder kinds
+			"reminder_rebuild": rebuild_reminder_timers,
+			# tasks.notifications.flush_notification_outbox
+			"notification_due": lambda: get_due_recipients(self.now - timedelta(minutes=30)),
+			# assignment.pick_assignee
+			"assignee_open": lambda: clear_open_counts(USERS[7:10]) or get_open_counts(USERS[7:10]),
+		}
+		for name, run in hot_paths.items():
+			with self.subTest(path=name):
+				self.assertPathUsesIndexes(run)
+
+	def test_permission_condition_uses_participant_index(self):
+		condition = work_item_user_condition(USERS[7])
+		self.assertNoFullScan(f"SELECT name FROM `tabWork Item` WHERE {condition}")
@@ -0,0 +1,149 @@
+# Copyright (c) 2026, Chethan - Aerele and Contributors
+# See license.txt
+
+import calendar
+from datetime import date, timedelta
+
+from frappe.tests.utils import FrappeTestCase
+
+from taskstream.taskstream.recurrence import DAYS_MAP, MONTH_MAP, WEEK_ORDER_MAP, RecurrenceRule
+
+TIMES = [timedelta(hours=9), timedelta(hours=17, minutes=30)]
+
+
+def day_by_day_occurrences(
+	recurrence_type,
+	start_date,
+	end_date,
+	frequency=1,
+	times=(),
+	weekdays=(),
+	monthly_based_on=None,
+	dates=(),
+	day_occurrences=(),
+	months=(),
+):
+	# The expansion RecurrenceRule replaced, kept as the reference: every day of the range is
+	# visited for Daily and Weekly, every month for Monthly
+	valid_dates = []
+	if recurrence_type == "Daily":
+		current_date = start_date
+		while current_date <= end_date:
+			if (current_date - start_date).days % frequency == 0:
+				valid_dates.extend((current_date, time_delta) for time_delta in times)
+			current_date += timedelta(days=1)
+
+	elif recurrence_type == "Weekly":
+		target_days = [DAYS_MAP[d] for d in weekdays]
+		current_date = start_date
+		while current_date <= end_date:
+			if (
+				current_date.weekday() in target_days
+				and (current_date - start_date).days // 7 % frequency == 0
+			):
+				valid_dates.extend((current_date, time_delta) for time_delta in times)
+			current_date += timedelta(days=1)
+
+	elif recurrence_type == "Monthly":
+		year, month = start_date.year, start_date.month
+		while date(year, month, 1) <= end_date:
+			if monthly_based_on == "Date":
+				last_day = calendar.monthrange(year, month)[1]
+				generated_dates = [date(year, month, min(day, last_day)) for day in dates]
+			else:
+				generated_dates = [
+					_get_nth_weekday(year, month, weekday, order) for order, weekday in day_occurrences
+				]
+			for generated_date in generated_dates:
+				if start_date < generated_date <= end_date:
+					for time_delta in times:
+						if (generated_date, time_delta) not in valid_dates:
+							valid_dates.append((generated_date, time_delta))
+			month += frequency
+			while month > 12:
+				month -= 12
+				year += 1
+
+	elif recurrence_type == "Yearly":
+		for year in range(start_date.year, end_date.year + 1, frequency):
+			for month in months:
+				for day in dates:
+					last_day = calendar.monthrange(year, MONTH_MAP[month])[1]
+					generated_date = date(year, MONTH_MAP[month], min(day, last_day))
+					if start_date < generated_date <= end_date:
+						valid_dates.extend((generated_date, time_delta) for time_delta in times)
+
+	return valid_dates
+
+
+def _get_nth_weekday(year, month, weekday, order):
+	first_occurrence = date(year, month, 1) + timedelta(
+		days=(DAYS_MAP[weekday] - date(year, month, 1).weekday()) % 7
+	)
+	occurrence = WEEK_ORDER_MAP[order]
+	if occurrence <= 4:
+		return first_occurrence + timedelta(weeks=occurrence - 1)
+	target_date = first_occurrence + timedelta(weeks=3)
+	if (target_date + timedelta(weeks=1)).month == month:
+		target_date += timedelta(weeks=1)
+	return target_date
+
+
+class TestRecurrenceRule(FrappeTestCase):
+	def assertSameOccurrences(self, recurrence_type, start_date, end_date, **options):
+		rule = RecurrenceRule(recurrence_type, times=TIMES, **options)
+		expected = day_by_day_occurrences(recurrence_type, start_date, end_date, times=TIMES, **options)
+		self.assertTrue(expected)
+		self.assertEqual(list(rule.occurrences(start_date, end_date)), expected)
+
+	def test_daily(self):
+		for frequency in (1, 3, 7):
+			with self.subTest(frequency=frequency):
+				self.assertSameOccurrences("Daily", date(2026, 1, 30), date(2026, 5, 2), frequency=frequency)
+
+	def test_weekly(self):
+		# Starts mid week, so the first week is partial and later weeks are counted from the start date
+		for frequency, weekdays in ((1, ["Monday", "Wednesday", "Friday"]), (2, ["Tuesday", "Sunday"])):
+			with self.subTest(frequency=frequency):
+				self.assertSameOccurrences(
+					"Weekly", date(2026, 1, 8), date(2026, 6, 30), frequency=frequency, weekdays=weekdays
+				)
+
+	def test_monthly_date(self):
+		# 29, 30 and 31 clamp to the end of short months and collapse into one slot in February
+		for frequency in (1, 5):
+			with self.subTest(frequency=frequency):
+				self.assertSameOccurrences(
+					"Monthly",
+					date(2026, 1, 15),
+					date(2029, 3, 31),
+					frequency=frequency,
+					monthly_based_on="Date",
+					dates=[31, 15, 30, 29],
+				)
+
+	def test_monthly_day(self):
+		# Last is the fifth weekday in months that have one and the fourth, a duplicate, otherwise
+		for frequency in (1, 2):
+			with self.subTest(frequency=frequency):
+				self.assertSameOccurrences(
+					"Monthly",
+					date(2026, 1, 1),
+					date(2028, 12, 31),
+					frequency=frequency,
+					monthly_based_on="Day",
+					day_occurrences=[("Last", "Friday"), ("First", "Monday"), ("Fourth", "Friday")],
+				)
+
+	def test_yearly(self):
+		# Feb 29 only exists in leap years, Feb 31 and Aug 31 clamp to the month end
+		for frequency in (1, 3):
+			with self.subTest(frequency=frequency):
+				self.assertSameOccurrences(
+					"Yearly",
+					date(2026, 2, 28),
+					date(2036, 8, 30),
+					frequency=frequency,
+					dates=[29, 31],
+					months=["February", "August"],
+				)